@@ -5,19 +5,19 @@ CREATE TABLE deputados (
     id INTEGER PRIMARY KEY,
     uri VARCHAR NOT NULL,
     nome_civil VARCHAR NOT NULL,
-    cpf VARCHAR,
-    sexo VARCHAR,
+    cpf VARCHAR(11),
+    sexo VARCHAR(1),
     url_website VARCHAR,
     data_nascimento DATE,
     data_falecimento DATE,
-    uf_nascimento VARCHAR,
+    uf_nascimento VARCHAR(2),
     municipio_nascimento VARCHAR,
     escolaridade VARCHAR,
     ultimo_status_id INTEGER,
     ultimo_status_nome VARCHAR,
     ultimo_status_sigla_partido VARCHAR,
     ultimo_status_uri_partido VARCHAR,
-    ultimo_status_sigla_uf VARCHAR,
+    ultimo_status_sigla_uf VARCHAR(2),
     ultimo_status_id_legislatura INTEGER,
     ultimo_status_url_foto VARCHAR,
     ultimo_status_email VARCHAR,
@@ -29,9 +29,10 @@ CREATE TABLE deputados (
     ultimo_status_descricao VARCHAR
 );
 
--- Expenses table
+-- Expenses table, partitioned by year so a full reload of one year is a
+-- DROP/CREATE of its partition instead of a table-wide DELETE
 CREATE TABLE despesas (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     deputado_id INTEGER NOT NULL REFERENCES deputados(id),
     ano INTEGER NOT NULL,
     mes INTEGER NOT NULL,
@@ -49,8 +50,12 @@ CREATE TABLE despesas (
     valor_glosa NUMERIC NOT NULL,
     num_ressarcimento VARCHAR,
     cod_lote INTEGER,
-    parcela INTEGER
-);
+    parcela INTEGER,
+    PRIMARY KEY (id, ano)
+) PARTITION BY RANGE (ano);
+
+-- Yearly partitions are created by app/database/create_tables.py (init-db), from
+-- DESPESAS_FIRST_YEAR up to next year
 
 -- Speeches table
 CREATE TABLE discursos (
@@ -83,16 +88,29 @@ CREATE TABLE votacoes (
 );
 
 -- Individual votes table
+CREATE TYPE tipo_voto_enum AS ENUM ('Sim', 'Não', 'Abstenção', 'Obstrução', 'Artigo 17');
+
 CREATE TABLE votos (
     id SERIAL PRIMARY KEY,
     votacao_id VARCHAR NOT NULL REFERENCES votacoes(id),
     deputado_id INTEGER NOT NULL REFERENCES deputados(id),
     data_registro_voto TIMESTAMP NOT NULL,
-    tipo_voto VARCHAR NOT NULL
+    tipo_voto tipo_voto_enum NOT NULL
 );
 
 -- Create indexes for foreign keys to improve query performance
-CREATE INDEX idx_despesas_deputado_id ON despesas(deputado_id);
+-- (despesas.deputado_id and votos.votacao_id are covered by the composite indexes below)
 CREATE INDEX idx_discursos_deputado_id ON discursos(deputado_id);
 CREATE INDEX idx_votos_deputado_id ON votos(deputado_id);
-CREATE INDEX idx_votos_votacao_id ON votos(votacao_id);
+CREATE INDEX idx_votos_tipo_voto ON votos(tipo_voto);
+CREATE INDEX idx_deputados_cpf ON deputados(cpf);
+
+-- Indexes for date filters and the common deputy/period lookup
+CREATE INDEX idx_despesas_data_documento ON despesas(data_documento);
+CREATE INDEX idx_discursos_data_hora_inicio ON discursos(data_hora_inicio);
+CREATE INDEX idx_votacoes_data ON votacoes(data);
+CREATE INDEX ix_despesas_dep_ano_mes ON despesas(deputado_id, ano, mes);
+
+-- Natural keys used to deduplicate incremental loads (INSERT ... ON CONFLICT)
+CREATE UNIQUE INDEX uq_despesas_deputado_documento ON despesas(deputado_id, cod_documento, ano);
+CREATE UNIQUE INDEX uq_votos_votacao_deputado ON votos(votacao_id, deputado_id);
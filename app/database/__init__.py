@@ -1,11 +1,21 @@
 # Database package initialization
-from .database import engine, SessionLocal, Base
+from .database import Base, get_engine, get_session_factory, get_db
 from .models import Deputado, Despesa, Discurso, Votacao, Voto
 
+def __getattr__(name):
+    # engine/SessionLocal are created lazily on first access
+    if name in ("engine", "SessionLocal"):
+        from . import database
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "engine", 
     "SessionLocal", 
     "Base", 
+    "get_engine", 
+    "get_session_factory", 
+    "get_db", 
     "Deputado", 
     "Despesa", 
     "Discurso", 
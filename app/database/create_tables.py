@@ -1,9 +1,127 @@
-from .database import engine, Base
-from .models import Deputado, Despesa, Discurso, Votacao, Voto
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from .database import get_engine, Base
+from .models import Deputado, Despesa, Discurso, Votacao, Voto, TIPOS_VOTO
+
+# Partitions are pre-created from the start of the 56th legislature
+DESPESAS_FIRST_YEAR = 2019
+
+# Composite indexes that take over from single-column ones. create_all only creates
+# indexes together with their table, so databases created by older schemas get
+# them here
+COVERING_INDEXES = {
+    "uq_votos_votacao_deputado":
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_votos_votacao_deputado ON votos (votacao_id, deputado_id)",
+    "uq_despesas_deputado_documento":
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_despesas_deputado_documento ON despesas (deputado_id, cod_documento, ano)",
+    "ix_despesas_dep_ano_mes":
+        "CREATE INDEX IF NOT EXISTS ix_despesas_dep_ano_mes ON despesas (deputado_id, ano, mes)",
+}
+
+# Indexes made redundant by a primary key (None) or by a composite index with the
+# same leading column, under both the SQLAlchemy (ix_) and the DDL.sql (idx_) names
+REDUNDANT_INDEXES = {
+    "ix_deputados_id": None,
+    "ix_votacoes_id": None,
+    "ix_despesas_deputado_id": "ix_despesas_dep_ano_mes",
+    "idx_despesas_deputado_id": "ix_despesas_dep_ano_mes",
+    "ix_votos_votacao_id": "uq_votos_votacao_deputado",
+    "idx_votos_votacao_id": "uq_votos_votacao_deputado",
+}
+
+
+def create_despesas_partition(conn: Connection, ano: int) -> None:
+    """Create the yearly partition of despesas for ``ano`` if it doesn't exist."""
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS despesas_{int(ano)} PARTITION OF despesas "
+        f"FOR VALUES FROM ({int(ano)}) TO ({int(ano) + 1})"
+    ))
+
+
+def ensure_despesas_partitions(conn: Connection, anos: Iterable[int]) -> None:
+    """Create the yearly partitions of despesas for every year in ``anos``."""
+    for ano in sorted(set(anos)):
+        create_despesas_partition(conn, ano)
+
+
+def ensure_covering_indexes(conn: Connection) -> None:
+    """
+    Create the COVERING_INDEXES missing from tables created by older schemas.
+
+    A unique index can't be built while the table holds duplicate keys; that
+    index is then skipped (in a savepoint, so the rest still runs) and the
+    indexes it would cover are kept.
+    """
+    for index_name, ddl in COVERING_INDEXES.items():
+        try:
+            with conn.begin_nested():
+                conn.execute(text(ddl))
+        except SQLAlchemyError as e:
+            print(f"Could not create index {index_name}: {e}")
+
+
+def drop_redundant_indexes(conn: Connection) -> None:
+    """
+    Drop the REDUNDANT_INDEXES left by older schemas; each one slows every write to its table.
+
+    An index is only dropped when the index covering it exists, so its columns
+    are never left unindexed.
+    """
+    existing = {
+        row[0] for row in conn.execute(text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"))
+    }
+    for index_name, covering_index in REDUNDANT_INDEXES.items():
+        if index_name not in existing:
+            continue
+        if covering_index is not None and covering_index not in existing:
+            print(f"Keeping index {index_name}: {covering_index} does not exist")
+            continue
+        conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+def migrate_tipo_voto(conn: Connection) -> None:
+    """
+    Convert votos.tipo_voto from VARCHAR (older schemas) to tipo_voto_enum.
+
+    create_all only creates the enum type together with a new votos table. The
+    conversion is skipped, with a message, while the column holds values outside
+    TIPOS_VOTO, since the cast would fail on them.
+    """
+    data_type = conn.execute(text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'votos' AND column_name = 'tipo_voto'"
+    )).scalar()
+    if data_type is None or data_type == "USER-DEFINED":
+        return
+
+    num_unknown = conn.execute(
+        text("SELECT count(*) FROM votos WHERE tipo_voto <> ALL(:tipos)"),
+        {"tipos": list(TIPOS_VOTO)}
+    ).scalar()
+    if num_unknown:
+        print(f"Keeping votos.tipo_voto as {data_type}: {num_unknown} rows have values outside TIPOS_VOTO")
+        return
+
+    Voto.__table__.c.tipo_voto.type.create(conn, checkfirst=True)
+    conn.execute(text(
+        "ALTER TABLE votos ALTER COLUMN tipo_voto TYPE tipo_voto_enum USING tipo_voto::tipo_voto_enum"
+    ))
+
 
 def create_tables():
     """Create all database tables if they don't exist."""
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        ensure_despesas_partitions(conn, range(DESPESAS_FIRST_YEAR, date.today().year + 2))
+        migrate_tipo_voto(conn)
+        ensure_covering_indexes(conn)
+        drop_redundant_indexes(conn)
     print("Database tables created successfully.")
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 import os
 import logging
 from sqlalchemy.orm import Session
-from .database import engine, SessionLocal
+from .database import get_session_factory
 from .models import Base
+from .create_tables import create_tables
 from app.ingestion.extract import extract_deputados, extract_votacoes, extract_votos
 from app.ingestion.transform import transform_deputados, transform_votacoes, transform_votos
 from app.ingestion.load import load_deputados, load_votacoes, load_votos
@@ -15,7 +16,7 @@ def init_db():
     """
     # Create tables
     logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    create_tables()
     logger.info("Tables created successfully.")
     
     # Ask user if they want to load initial data
@@ -25,7 +26,7 @@ def init_db():
         logger.info("Loading initial data...")
         
         # Get a database session
-        db = SessionLocal()
+        db = get_session_factory()()
         
         try:
             # Extract data - unified approach for deputados
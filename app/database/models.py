@@ -1,21 +1,24 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean, Text, JSON, Index, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from .database import Base
 
+# Valores possíveis de tipoVoto na API (Artigo 17 = presidente da sessão)
+TIPOS_VOTO = ('Sim', 'Não', 'Abstenção', 'Obstrução', 'Artigo 17')
+
 class Deputado(Base):
     __tablename__ = "deputados"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     uri = Column(String, nullable=False)
     nome_civil = Column(String, nullable=False)
-    cpf = Column(String, nullable=True)
-    sexo = Column(String, nullable=True)
+    cpf = Column(String(11), nullable=True, index=True)
+    sexo = Column(String(1), nullable=True)
     escolaridade = Column(String, nullable=True)
     url_website = Column(String, nullable=True)
     data_nascimento = Column(Date, nullable=True)
     data_falecimento = Column(Date, nullable=True)
-    uf_nascimento = Column(String, nullable=True)
+    uf_nascimento = Column(String(2), nullable=True)
     municipio_nascimento = Column(String, nullable=True)
     
     # UltimoStatus fields
@@ -23,7 +26,7 @@ class Deputado(Base):
     ultimo_status_nome = Column(String, nullable=True)
     ultimo_status_sigla_partido = Column(String, nullable=True)
     ultimo_status_uri_partido = Column(String, nullable=True)
-    ultimo_status_sigla_uf = Column(String, nullable=True)
+    ultimo_status_sigla_uf = Column(String(2), nullable=True)
     ultimo_status_id_legislatura = Column(Integer, nullable=True)
     ultimo_status_url_foto = Column(String, nullable=True)
     ultimo_status_email = Column(String, nullable=True)
@@ -47,14 +50,16 @@ class Despesa(Base):
     __tablename__ = "despesas"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    # Buscas por deputado usam os índices compostos abaixo, que começam por deputado_id
     deputado_id = Column(Integer, ForeignKey("deputados.id"), nullable=False)
-    ano = Column(Integer, nullable=False)
+    # Chave de particionamento: precisa fazer parte da PK e dos índices únicos
+    ano = Column(Integer, primary_key=True, nullable=False)
     mes = Column(Integer, nullable=False)
     tipo_despesa = Column(String, nullable=False)
     cod_documento = Column(Integer, nullable=False)
     tipo_documento = Column(String, nullable=False)
     cod_tipo_documento = Column(Integer, nullable=False)
-    data_documento = Column(Date, nullable=False)
+    data_documento = Column(Date, nullable=False, index=True)
     num_documento = Column(String, nullable=False)
     valor_documento = Column(Float, nullable=False)
     url_documento = Column(String, nullable=False)
@@ -69,6 +74,12 @@ class Despesa(Base):
     # Relationship
     deputado = relationship("Deputado", back_populates="despesas")
 
+    __table_args__ = (
+        Index("uq_despesas_deputado_documento", "deputado_id", "cod_documento", "ano", unique=True),
+        Index("ix_despesas_dep_ano_mes", "deputado_id", "ano", "mes"),
+        {"postgresql_partition_by": "RANGE (ano)"},
+    )
+
     def __repr__(self):
         return f"<Despesa(id={self.id}, deputado_id={self.deputado_id}, valor={self.valor_documento})>"
 
@@ -77,8 +88,8 @@ class Discurso(Base):
     __tablename__ = "discursos"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    deputado_id = Column(Integer, ForeignKey("deputados.id"), nullable=False)
-    data_hora_inicio = Column(DateTime, nullable=True)
+    deputado_id = Column(Integer, ForeignKey("deputados.id"), nullable=False, index=True)
+    data_hora_inicio = Column(DateTime, nullable=True, index=True)
     data_hora_fim = Column(DateTime, nullable=True)
     fase_evento = Column(JSON, nullable=True)
     tipo_discurso = Column(String, nullable=False)
@@ -99,9 +110,9 @@ class Discurso(Base):
 class Votacao(Base):
     __tablename__ = "votacoes"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True)
     uri = Column(String, nullable=False)
-    data = Column(Date, nullable=False)
+    data = Column(Date, nullable=False, index=True)
     data_hora_registro = Column(DateTime, nullable=False)
     sigla_orgao = Column(String, nullable=False)
     uri_orgao = Column(String, nullable=False)
@@ -121,14 +132,19 @@ class Voto(Base):
     __tablename__ = "votos"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    # Buscas por votação usam uq_votos_votacao_deputado, que começa por votacao_id
     votacao_id = Column(String, ForeignKey("votacoes.id"), nullable=False)
-    deputado_id = Column(Integer, ForeignKey("deputados.id"), nullable=False)
+    deputado_id = Column(Integer, ForeignKey("deputados.id"), nullable=False, index=True)
     data_registro_voto = Column(DateTime, nullable=False)
-    tipo_voto = Column(String, nullable=False)
+    tipo_voto = Column(Enum(*TIPOS_VOTO, name='tipo_voto_enum'), nullable=False, index=True)
     
     # Relationships
     votacao = relationship("Votacao", back_populates="votos")
     deputado = relationship("Deputado", back_populates="votos")
 
+    __table_args__ = (
+        Index("uq_votos_votacao_deputado", "votacao_id", "deputado_id", unique=True),
+    )
+
     def __repr__(self):
         return f"<Voto(votacao_id='{self.votacao_id}', deputado_id={self.deputado_id}, tipo='{self.tipo_voto}')>"
\ No newline at end of file
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+from tqdm.asyncio import tqdm as tqdm_async
+
+from app.config import API_TIMEOUT, API_RETRIES, API_MAX_CONNECTIONS, API_MAX_PER_SECOND
+from app.ingestion.utils import RateLimiter, PROGRESS_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# Respostas que indicam sobrecarga temporária e valem nova tentativa
+STATUS_RETRY = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 60.0
+
+# Compartilhado por todos os lotes, para respeitar o limite entre execuções seguidas
+_LIMITADOR = RateLimiter(API_MAX_PER_SECOND)
+
+def _criar_cliente() -> httpx.AsyncClient:
+    """
+    Cria o cliente HTTP assíncrono compartilhado pelas requisições de um lote.
+    
+    Returns:
+        httpx.AsyncClient com HTTP/2 e pool de conexões limitado
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=API_TIMEOUT,
+        limits=httpx.Limits(max_connections=API_MAX_CONNECTIONS,
+                            max_keepalive_connections=API_MAX_CONNECTIONS)
+    )
+
+def _tempo_espera(tentativa: int, resposta: Optional[httpx.Response] = None) -> float:
+    """
+    Calcula a espera antes de uma nova tentativa.
+    
+    Respeita o cabeçalho Retry-After quando a API o envia; caso contrário usa
+    backoff exponencial.
+    
+    Args:
+        tentativa: Número da tentativa que falhou, começando em 0
+        resposta: Resposta recebida, se houver
+        
+    Returns:
+        Tempo de espera em segundos
+    """
+    if resposta is not None:
+        retry_after = resposta.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return min(BACKOFF_BASE * 2 ** tentativa, BACKOFF_MAX)
+
+async def requisitar_json_async(client: httpx.AsyncClient, url: str, parametros: Optional[Dict] = None,
+                                semaforo: Optional[asyncio.Semaphore] = None) -> Optional[Dict]:
+    """
+    Versão assíncrona de requisitar_json.
+    
+    Erros de rede e respostas 429/5xx são repetidos até API_RETRIES vezes com
+    backoff exponencial (ou o Retry-After informado pela API). O envio respeita
+    o limite de API_MAX_PER_SECOND requisições por segundo.
+    
+    Args:
+        client: Cliente HTTP assíncrono
+        url: URL da API
+        parametros: Parâmetros da requisição
+        semaforo: Limita quantas requisições ficam em voo ao mesmo tempo
+        
+    Returns:
+        JSON da resposta como dict, ou None se a requisição falhar
+    """
+    resposta = None
+    for tentativa in range(API_RETRIES + 1):
+        try:
+            if semaforo is None:
+                await _LIMITADOR.wait_async()
+                resposta = await client.get(url, params=parametros)
+            else:
+                async with semaforo:
+                    await _LIMITADOR.wait_async()
+                    resposta = await client.get(url, params=parametros)
+        except httpx.HTTPError as e:
+            if tentativa == API_RETRIES:
+                logger.warning(f"Request to {url} failed: {e}")
+                return None
+            await asyncio.sleep(_tempo_espera(tentativa))
+            continue
+        
+        if resposta.status_code not in STATUS_RETRY or tentativa == API_RETRIES:
+            break
+        await asyncio.sleep(_tempo_espera(tentativa, resposta))
+    
+    if resposta.status_code == 200:
+        try:
+            return orjson.loads(resposta.content)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Invalid JSON from {url}: {e}")
+            return None
+    
+    # 4xx trazem no corpo a mensagem de erro da API; 5xx/429 aqui já esgotaram as tentativas
+    if 400 <= resposta.status_code < 500 and resposta.status_code != 429:
+        logger.warning(f"Request to {url} returned {resposta.status_code}: {resposta.text[:500]}")
+    else:
+        logger.warning(f"Request to {url} returned {resposta.status_code} after {API_RETRIES} retries")
+    return None
+
+async def _buscar_todos(requisicoes: List[Tuple[str, Optional[Dict]]],
+                        desc: Optional[str]) -> List[Optional[Dict]]:
+    # Com HTTP/2 várias requisições compartilham a mesma conexão, então o
+    # limite de conexões sozinho não limita a concorrência
+    semaforo = asyncio.Semaphore(API_MAX_CONNECTIONS)
+    async with _criar_cliente() as client:
+        return await tqdm_async.gather(
+            *(requisitar_json_async(client, url, parametros, semaforo)
+              for url, parametros in requisicoes),
+            desc=desc,
+            **PROGRESS_OPTIONS
+        )
+
+def requisitar_json_async_lote(requisicoes: List[Tuple[str, Optional[Dict]]],
+                               desc: Optional[str] = None) -> List[Optional[Dict]]:
+    """
+    Realiza várias requisições concorrentes em um único event loop.
+    
+    Pode ser chamada de código síncrono (tasks do Prefect). Se já houver um
+    event loop ativo na thread atual, o lote roda em uma thread auxiliar.
+    
+    Args:
+        requisicoes: Lista de tuplas (url, parametros)
+        desc: Descrição exibida na barra de progresso
+        
+    Returns:
+        Lista com o JSON de cada resposta (ou None), na mesma ordem da entrada
+    """
+    coro = _buscar_todos(requisicoes, desc)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -4,20 +4,10 @@ Script to run ETL processes via command line or cron jobs.
 """
 import argparse
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
-from app.config import LOG_FILE
-from app.ingestion.flow import camara_analytics_etl_flow
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+# Importing the flow configures logging (see app.ingestion.utils.configure_logging)
+from app.ingestion.flow import run_etl
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +17,9 @@ if __name__ == "__main__":
                         help="ETL mode (full or incremental)")
     parser.add_argument("--entity", type=str, default="all", choices= ["deputados", "votacoes", "votos", "discursos", "all"],
                         help="Entity to process (deputados, votacoes, votos, or all)")
-    parser.add_argument("--start-date", type=str, default=None,
+    parser.add_argument("--start-date", type=date.fromisoformat, default=None,
                         help="Start date for extraction (YYYY-MM-DD)")
-    parser.add_argument("--end-date", type=str, default=None,
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
                         help="End date for extraction (YYYY-MM-DD)")
     parser.add_argument("--days", type=int, default=None,
                         help="Number of days back from today to start extraction")
@@ -38,7 +28,7 @@ if __name__ == "__main__":
     
     # Handle date calculation if days parameter is provided
     if args.days and not args.start_date:
-        start_date = (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d")
+        start_date = date.today() - timedelta(days=args.days)
         args.start_date = start_date
         logger.info(f"Calculated start date from --days: {start_date}")
     
@@ -46,7 +36,7 @@ if __name__ == "__main__":
         logger.info(f"Starting ETL process in {args.mode} mode for entity: {args.entity}")
         
         # Run the flow
-        results = camara_analytics_etl_flow(
+        results = run_etl(
             mode=args.mode,
             entities=[args.entity] if args.entity != "all" else None,
             data_inicio=args.start_date,
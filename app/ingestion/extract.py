@@ -1,44 +1,391 @@
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from datetime import date, datetime, timedelta
+import orjson
 import pandas as pd
+import pyarrow as pa
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from prefect import task
+from prefect.cache_policies import NO_CACHE
 from tqdm import tqdm
 
 from app.ingestion.utils import (
     save_dataframe, 
     load_dataframe, 
+    concat_frames, 
+    to_categories, 
+    write_parquet_chunks, 
+    ParquetChunkWriter, 
+    RateLimiter, 
+    PROGRESS_OPTIONS, 
     get_last_update_date, 
     update_last_update_date
 )
-from app.config import YESTERDAY, TODAY
+from app.config import (
+    yesterday, 
+    today, 
+    API_BASE_URL, 
+    API_TIMEOUT, 
+    API_RETRIES, 
+    API_MAX_WORKERS, 
+    API_CACHE_EXPIRE_HOURS, 
+    API_MAX_PER_SECOND, 
+    API_ASYNC, 
+    VOTOS_BATCH_SIZE, 
+    RAW_DATA_DIR
+)
+from app.ingestion.api_async import requisitar_json_async_lote
 
 logger = logging.getLogger(__name__)
 
+# Campos que só existem no endpoint de detalhes (/deputados/{id})
+REQUIRED_DETAIL_FIELDS = ['nomeCivil', 'cpf', 'sexo', 'dataNascimento']
+
+# Campos da listagem (/deputados) que também aparecem no registro detalhado
+LIST_FIELDS = ['nome', 'siglaPartido', 'uriPartido', 'siglaUf', 'idLegislatura', 'urlFoto', 'email']
+
+# Colunas com poucos valores distintos, guardadas como category
+CATEGORY_COLUMNS = {
+    'deputados': ['siglaPartido', 'siglaUf', 'ufNascimento', 'sexo', 'escolaridade', 'situacao', 'condicaoEleitoral'],
+    'votacoes': ['siglaOrgao'],
+    'votos': ['tipoVoto'],
+}
+
+# Campos do gabinete achatados como gabinete_<campo>
+GABINETE_FIELDS = ['nome', 'predio', 'sala', 'andar', 'telefone', 'email']
+
+# Campos do ultimoStatus expostos no registro achatado com o nome original da API
+ULTIMO_STATUS_FIELDS = [
+    'nome', 'siglaPartido', 'uriPartido', 'siglaUf', 'idLegislatura', 'urlFoto', 'email',
+    'data', 'nomeEleitoral', 'situacao', 'condicaoEleitoral', 'descricaoStatus'
+]
+
+# Colunas geradas por pd.json_normalize -> nomes usados no registro achatado
+COLUNAS_DEPUTADO = {
+    **{campo: campo for campo in [
+        'id', 'uri', 'nomeCivil', 'cpf', 'sexo', 'urlWebsite', 'dataNascimento', 'dataFalecimento',
+        'ufNascimento', 'municipioNascimento', 'escolaridade', 'redeSocial'
+    ]},
+    **{f'ultimoStatus_{campo}': campo for campo in ULTIMO_STATUS_FIELDS},
+    **{f'ultimoStatus_gabinete_{campo}': f'gabinete_{campo}' for campo in GABINETE_FIELDS},
+}
+
 # -- Funções de API incorporadas --
 
-def fazer_requisicao(url, parametros=None, returnar_df=True):
+# Endpoints usados pelo ETL: caminho relativo a API_BASE_URL e parâmetros aceitos
+ENDPOINTS = {
+    'deputados': ('/deputados', frozenset({
+        'nome', 'idLegislatura', 'siglaUf', 'siglaPartido', 'siglaSexo',
+        'dataInicio', 'dataFim', 'pagina', 'itens', 'ordem', 'ordenarPor'
+    })),
+    'deputado': ('/deputados/{id}', frozenset()),
+    'discursos_deputado': ('/deputados/{id}/discursos', frozenset({
+        'idLegislatura', 'dataInicio', 'dataFim', 'pagina', 'itens', 'ordem', 'ordenarPor'
+    })),
+    'votacoes': ('/votacoes', frozenset({
+        'idProposicao', 'idEvento', 'idOrgao', 'dataInicio', 'dataFim',
+        'pagina', 'itens', 'ordem', 'ordenarPor'
+    })),
+    'votos_votacao': ('/votacoes/{id}/votos', frozenset()),
+}
+
+# Endpoints cujas respostas praticamente não mudam entre execuções. Os demais
+# (listagem de votações por data, discursos) nunca são armazenados em cache.
+_CACHE_TTL = timedelta(hours=API_CACHE_EXPIRE_HOURS)
+_URLS_EXPIRE_AFTER = {
+    f'{API_BASE_URL}/deputados/*/discursos': requests_cache.DO_NOT_CACHE,
+    f'{API_BASE_URL}/deputados': _CACHE_TTL,
+    f'{API_BASE_URL}/votacoes/*/votos': _CACHE_TTL,
+    '*': requests_cache.DO_NOT_CACHE,
+}
+
+# Sessão HTTP compartilhada: reaproveita conexões (keep-alive) entre requisições
+# e guarda em disco as respostas dos endpoints estáticos. Respostas expiradas que
+# trazem ETag/Last-Modified são revalidadas com If-None-Match/If-Modified-Since
+# (um 304 reaproveita o corpo em cache); se a API falhar, a cópia expirada é usada
+if API_CACHE_EXPIRE_HOURS > 0:
+    _SESSION = requests_cache.CachedSession(
+        cache_name=os.path.join(RAW_DATA_DIR, 'http_cache'),
+        backend='sqlite',
+        urls_expire_after=_URLS_EXPIRE_AFTER,
+        allowable_methods=('GET',),
+        stale_if_error=True
+    )
+else:
+    _SESSION = requests.Session()
+# Limita a taxa de requisições à API. Fica no adapter para que respostas servidas
+# pelo cache não consumam a cota
+_LIMITADOR = RateLimiter(API_MAX_PER_SECOND)
+
+class _AdaptadorLimitado(HTTPAdapter):
+    def send(self, request, *args, **kwargs):
+        _LIMITADOR.wait()
+        return super().send(request, *args, **kwargs)
+
+# O pool acompanha o número de threads: com menos conexões que workers o urllib3
+# descarta conexões excedentes e perde o keep-alive
+_SESSION.mount("https://", _AdaptadorLimitado(
+    pool_connections=max(API_MAX_WORKERS, 32),
+    pool_maxsize=max(API_MAX_WORKERS, 32),
+    max_retries=Retry(
+        total=API_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+def montar_requisicao(endpoint: str, id: Any = None, **parametros) -> Tuple[str, Optional[Dict]]:
+    """
+    Monta a URL e os parâmetros de um endpoint da tabela ENDPOINTS.
+    
+    Args:
+        endpoint: Nome do endpoint em ENDPOINTS
+        id: Identificador usado nos caminhos com {id}
+        **parametros: Parâmetros de consulta; valores None são descartados
+        
+    Returns:
+        Tupla (url, parametros), pronta para requisitar_json/requisitar_df
+        
+    Raises:
+        ValueError: Se algum parâmetro não for aceito pelo endpoint
+    """
+    caminho, permitidos = ENDPOINTS[endpoint]
+    invalidos = parametros.keys() - permitidos
+    if invalidos:
+        raise ValueError(f"Invalid parameters for endpoint {endpoint}: {sorted(invalidos)}")
+    
+    url = API_BASE_URL + caminho.format(id=id)
+    parametros = {chave: valor for chave, valor in parametros.items() if valor is not None}
+    return url, parametros or None
+
+def requisitar_json(url: str, parametros: Optional[Dict] = None) -> Optional[Dict]:
     """
     Realiza uma requisição HTTP para a API da Câmara dos Deputados.
     
     Args:
         url: URL da API
         parametros: Parâmetros da requisição
-        returnar_df: Se True, retorna um DataFrame, senão retorna o JSON original
         
     Returns:
-        DataFrame ou dict com os dados da API, ou None se a requisição falhar
+        JSON da resposta como dict, ou None se a requisição falhar
     """
-    resposta = requests.get(url, params=parametros)
+    try:
+        resposta = _SESSION.get(url, params=parametros, timeout=API_TIMEOUT)
+    except requests.RequestException as e:
+        logger.warning(f"Request to {url} failed: {e}")
+        return None
+    
     if resposta.status_code == 200:
-        dados = resposta.json()
-        if returnar_df and 'dados' in dados and type(dados['dados']) == list: 
-            return pd.DataFrame(dados['dados'])
+        try:
+            return orjson.loads(resposta.content)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Invalid JSON from {url}: {e}")
+            return None
+    
+    # 4xx trazem no corpo a mensagem de erro da API; 5xx/429 aqui já esgotaram as tentativas
+    if 400 <= resposta.status_code < 500 and resposta.status_code != 429:
+        logger.warning(f"Request to {url} returned {resposta.status_code}: {resposta.text[:500]}")
+    else:
+        logger.warning(f"Request to {url} returned {resposta.status_code} after {API_RETRIES} retries")
+    return None
+
+def requisitar_df(url: str, parametros: Optional[Dict] = None) -> Optional[pd.DataFrame]:
+    """
+    Realiza uma requisição a um endpoint de listagem e monta um DataFrame com o campo 'dados'.
+    
+    Args:
+        url: URL da API
+        parametros: Parâmetros da requisição
+        
+    Returns:
+        DataFrame com os registros, ou None se a requisição falhar
+    """
+    dados = requisitar_json(url, parametros)
+    if dados is None or not isinstance(dados.get('dados'), list):
+        return None
+    return pd.DataFrame(dados['dados'])
+
+def iterar_requisicoes_paralelas(requisicoes: List[Tuple[str, Optional[Dict]]],
+                                 desc: Optional[str] = None) -> Iterator[Optional[Dict]]:
+    """
+    Realiza várias requisições em paralelo usando um pool de threads.
+    Com API_ASYNC ativo, delega para o cliente assíncrono (httpx + HTTP/2).
+    
+    Os resultados são entregues conforme ficam prontos, na ordem da entrada,
+    para que o chamador possa processá-los sem acumular todas as respostas.
+    
+    Args:
+        requisicoes: Lista de tuplas (url, parametros)
+        desc: Descrição exibida na barra de progresso
+        
+    Yields:
+        JSON de cada resposta (ou None), na mesma ordem da entrada
+    """
+    if API_ASYNC:
+        yield from requisitar_json_async_lote(requisicoes, desc=desc)
+        return
+    
+    with ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as executor:
+        resultados = executor.map(lambda req: requisitar_json(*req), requisicoes)
+        yield from tqdm(resultados, total=len(requisicoes), desc=desc, **PROGRESS_OPTIONS)
+
+def fazer_requisicoes_paralelas(requisicoes: List[Tuple[str, Optional[Dict]]],
+                                desc: Optional[str] = None) -> List[Optional[Dict]]:
+    """
+    Realiza várias requisições em paralelo e devolve todos os resultados.
+    
+    Args:
+        requisicoes: Lista de tuplas (url, parametros)
+        desc: Descrição exibida na barra de progresso
+        
+    Returns:
+        Lista com o JSON de cada resposta (ou None), na mesma ordem da entrada
+    """
+    return list(iterar_requisicoes_paralelas(requisicoes, desc=desc))
+
+def registros_com_id(resposta: Optional[Dict], coluna: str, valor: Any) -> Optional[pa.Table]:
+    """
+    Converte os registros de uma resposta de listagem direto para Arrow,
+    acrescentando uma coluna constante com o ID consultado.
+    
+    Args:
+        resposta: JSON retornado pela API
+        coluna: Nome da coluna de ID a acrescentar
+        valor: ID usado na requisição
+        
+    Returns:
+        Tabela Arrow, ou None se a resposta não tiver registros
+    """
+    registros = (resposta or {}).get('dados')
+    if not registros or not isinstance(registros, list):
+        return None
+    tabela = pa.Table.from_pylist(registros)
+    return tabela.append_column(coluna, pa.repeat(valor, tabela.num_rows))
+
+def selecionar_deputados_inalterados(df_lista: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Seleciona os deputados já extraídos que não precisam ser buscados novamente.
+    
+    Um deputado é reaproveitado quando o registro salvo possui todos os campos de
+    detalhe obrigatórios e os campos da listagem não mudaram desde a última extração.
+    
+    Args:
+        df_lista: DataFrame retornado pela listagem de deputados
+        
+    Returns:
+        DataFrame com os registros detalhados reaproveitáveis, ou None se não houver
+    """
+    df_anterior = load_dataframe("deputados")
+    if df_anterior is None or df_anterior.empty:
+        return None
+    
+    if not set(REQUIRED_DETAIL_FIELDS + LIST_FIELDS).issubset(df_anterior.columns):
+        return None
+    
+    campos = [campo for campo in LIST_FIELDS if campo in df_lista.columns]
+    completos = df_anterior.dropna(subset=REQUIRED_DETAIL_FIELDS)
+    comparacao = df_lista[['id'] + campos].merge(
+        completos[['id'] + campos], on='id', suffixes=('', '_anterior')
+    )
+    
+    inalterados = pd.Series(True, index=comparacao.index)
+    for campo in campos:
+        atual = comparacao[campo]
+        anterior = comparacao[f'{campo}_anterior']
+        inalterados &= (atual == anterior) | (atual.isna() & anterior.isna())
+    
+    df_inalterados = completos[completos['id'].isin(comparacao.loc[inalterados, 'id'])]
+    return df_inalterados if not df_inalterados.empty else None
+
+def _gerar_achatador_deputado() -> Any:
+    """
+    Gera, a partir de COLUNAS_DEPUTADO, uma função que achata um registro de
+    deputado em uma tupla na ordem de COLUNAS_ACHATADAS.
+    
+    Como o esquema é fixo, cada campo vira um acesso direto no código gerado,
+    sem a recursão genérica do pd.json_normalize.
+    """
+    campos = []
+    for coluna in COLUNAS_DEPUTADO:
+        if coluna.startswith('ultimoStatus_gabinete_'):
+            campos.append(f"g.get({coluna[len('ultimoStatus_gabinete_'):]!r})")
+        elif coluna.startswith('ultimoStatus_'):
+            campos.append(f"s.get({coluna[len('ultimoStatus_'):]!r})")
         else:
-           return dados
+            campos.append(f"d.get({coluna!r})")
+    fonte = (
+        "def achatar(d):\n"
+        "    s = d.get('ultimoStatus') or {}\n"
+        "    g = s.get('gabinete') or {}\n"
+        f"    return ({', '.join(campos)}, d.get('ultimoStatus'), s.get('gabinete') or None)\n"
+    )
+    namespace = {}
+    exec(compile(fonte, '<achatar_deputado>', 'exec'), namespace)
+    return namespace['achatar']
+
+# Colunas do registro achatado, mais os objetos aninhados preservados como dicts
+COLUNAS_ACHATADAS = list(COLUNAS_DEPUTADO.values()) + ['ultimo_status', 'gabinete']
+_ACHATAR_DEPUTADO = _gerar_achatador_deputado()
+
+def achatar_deputados(registros: List[Dict]) -> pd.DataFrame:
+    """
+    Achata os registros detalhados de deputados em um DataFrame.
+    
+    Args:
+        registros: Lista com o campo 'dados' de cada resposta de /deputados/{id}
         
-    return None
+    Returns:
+        DataFrame com as colunas de COLUNAS_DEPUTADO, mais os objetos
+        'ultimo_status' e 'gabinete' preservados como dicts (None se ausentes)
+    """
+    return pd.DataFrame([_ACHATAR_DEPUTADO(registro) for registro in registros], columns=COLUNAS_ACHATADAS)
+
+def para_data(valor: Union[date, str, None]) -> Optional[date]:
+    """
+    Converte uma data (date, datetime ou string YYYY-MM-DD) para date.
+    
+    Args:
+        valor: Data a converter; None é mantido
+        
+    Returns:
+        date correspondente, ou None
+    """
+    if valor is None or type(valor) is date:
+        return valor
+    if isinstance(valor, datetime):
+        return valor.date()
+    return date.fromisoformat(valor)
+
+def gerar_intervalos_mensais(inicio: date, fim: date) -> List[Tuple[str, str]]:
+    """
+    Divide o período [inicio, fim] em intervalos de no máximo um mês de calendário.
+    
+    Args:
+        inicio: Data inicial (inclusive)
+        fim: Data final (inclusive)
+        
+    Returns:
+        Lista de tuplas (inicio, fim) no formato YYYY-MM-DD
+    """
+    inicio = pd.Timestamp(inicio).normalize()
+    fim = pd.Timestamp(fim).normalize()
+    if inicio > fim:
+        return []
+    
+    # Primeiro dia de cada mês no período, mais o início quando ele cai no meio do mês
+    inicios = pd.date_range(inicio, fim, freq='MS')
+    if len(inicios) == 0 or inicios[0] != inicio:
+        inicios = inicios.insert(0, inicio)
+    fins = pd.Series(inicios + pd.offsets.MonthEnd(0)).clip(upper=fim)
+    
+    return list(zip(inicios.strftime('%Y-%m-%d'), fins.dt.strftime('%Y-%m-%d')))
 
 # -- Funções de extração --
 
@@ -57,8 +404,7 @@ def extract_deputados(mode: str = "full") -> pd.DataFrame:
     logger.info(f"Extracting deputados with unified approach in {mode} mode")
     
     # Primeiro obtém a lista de IDs de deputados ativos
-    url = 'https://dadosabertos.camara.leg.br/api/v2/deputados'
-    df_deputies_list = fazer_requisicao(url)
+    df_deputies_list = requisitar_df(*montar_requisicao('deputados'))
     
     if df_deputies_list is None or df_deputies_list.empty:
         logger.warning("No deputados list found")
@@ -68,133 +414,82 @@ def extract_deputados(mode: str = "full") -> pd.DataFrame:
     deputados_data = []
     ids = df_deputies_list['id'].tolist()
     
+    # No modo incremental, reaproveita os detalhes de deputados sem alteração
+    df_inalterados = None
+    if mode == "incremental":
+        df_inalterados = selecionar_deputados_inalterados(df_deputies_list)
+        if df_inalterados is not None:
+            ids_inalterados = set(df_inalterados['id'])
+            ids = [deputy_id for deputy_id in ids if deputy_id not in ids_inalterados]
+            logger.info(f"Reusing details for {len(ids_inalterados)} unchanged deputados")
+    
     logger.info(f"Extracting details for {len(ids)} deputados")
     
-    for deputy_id in tqdm(ids, desc="Extracting deputados details"):
-        url = f'https://dadosabertos.camara.leg.br/api/v2/deputados/{deputy_id}'
-        response = fazer_requisicao(url, returnar_df=False)
-        
+    requisicoes = [montar_requisicao('deputado', deputy_id) for deputy_id in ids]
+    respostas = fazer_requisicoes_paralelas(requisicoes, desc="Extracting deputados details")
+    
+    for deputy_id, response in zip(ids, respostas):
         if response and 'dados' in response:
-            # Process the detailed data into a flattened structure
-            deputy_data = response['dados']
-            
-            # Extract ultimo_status fields
-            ultimo_status = deputy_data.get('ultimoStatus', {})
-            
-            # Create a flattened record
-            flat_data = {
-                # Basic info
-                'id': deputy_data.get('id'),
-                'uri': deputy_data.get('uri'),
-                'nomeCivil': deputy_data.get('nomeCivil'),
-                'cpf': deputy_data.get('cpf'),
-                'sexo': deputy_data.get('sexo'),
-                'urlWebsite': deputy_data.get('urlWebsite'),
-                'dataNascimento': deputy_data.get('dataNascimento'),
-                'dataFalecimento': deputy_data.get('dataFalecimento'),
-                'ufNascimento': deputy_data.get('ufNascimento'),
-                'municipioNascimento': deputy_data.get('municipioNascimento'),
-                'escolaridade': deputy_data.get('escolaridade'),
-                
-                # Include social media if available
-                'redeSocial': deputy_data.get('redeSocial', []),
-                
-                # Último status fields - mantém nomes originais da API para compatibilidade
-                'ultimo_status': ultimo_status,
-                'nome': ultimo_status.get('nome'),
-                'siglaPartido': ultimo_status.get('siglaPartido'),
-                'uriPartido': ultimo_status.get('uriPartido'),
-                'siglaUf': ultimo_status.get('siglaUf'),
-                'idLegislatura': ultimo_status.get('idLegislatura'),
-                'urlFoto': ultimo_status.get('urlFoto'),
-                'email': ultimo_status.get('email'),
-                'data': ultimo_status.get('data'),
-                'nomeEleitoral': ultimo_status.get('nomeEleitoral'),
-                'situacao': ultimo_status.get('situacao'),
-                'condicaoEleitoral': ultimo_status.get('condicaoEleitoral'),
-                'descricaoStatus': ultimo_status.get('descricaoStatus')
-            }
-            
-            # Add gabinete data if present
-            gabinete = ultimo_status.get('gabinete', {})
-            if gabinete:
-                flat_data['gabinete'] = gabinete
-                flat_data['gabinete_nome'] = gabinete.get('nome')
-                flat_data['gabinete_predio'] = gabinete.get('predio')
-                flat_data['gabinete_sala'] = gabinete.get('sala')
-                flat_data['gabinete_andar'] = gabinete.get('andar')
-                flat_data['gabinete_telefone'] = gabinete.get('telefone')
-                flat_data['gabinete_email'] = gabinete.get('email')
-            
-            deputados_data.append(flat_data)
+            deputados_data.append(response['dados'])
         else:
             logger.warning(f"No details found for deputado {deputy_id}")
     
-    if not deputados_data:
+    if not deputados_data and df_inalterados is None:
         logger.warning("No deputados details found")
         return None
     
-    # Create DataFrame with all data
-    df_deputados = pd.DataFrame(deputados_data)
+    # Achata os registros de uma vez; campos ausentes viram NaN
+    df_deputados = achatar_deputados(deputados_data)
+    if df_inalterados is not None:
+        df_deputados = concat_frames([df_inalterados, df_deputados])
     
     # Save raw data
+    to_categories(df_deputados, CATEGORY_COLUMNS['deputados'])
+    
     save_dataframe(df_deputados, "deputados")
     update_last_update_date("deputados")
     
     return df_deputados
 
 @task(name="Extract Votacoes")
-def extract_votacoes(mode: str = "full", data_inicio: Optional[str] = None, data_fim: Optional[str] = None) -> pd.DataFrame:
+def extract_votacoes(mode: str = "full", data_inicio: Optional[date] = None, data_fim: Optional[date] = None) -> pd.DataFrame:
     """
     Extrai dados de votações da API da Câmara.
     
     Args:
         mode: 'full' para extração completa, 'incremental' para incremental
-        data_inicio: Data de início para extração (formato: YYYY-MM-DD)
-        data_fim: Data de fim para extração (formato: YYYY-MM-DD)
+        data_inicio: Data de início para extração (date ou string YYYY-MM-DD)
+        data_fim: Data de fim para extração (date ou string YYYY-MM-DD)
         
     Returns:
         DataFrame com dados das votações
     """
+    data_inicio = para_data(data_inicio)
+    data_fim = para_data(data_fim)
+    
     if mode == "incremental":
-        # Para incremental, usa a última data de atualização ou ontem como data_inicio
+        # Para incremental, usa a última data de atualização ou ontem como data_inicio.
+        # O dia da última atualização é buscado de novo: o arquivo guarda só a data, e
+        # votações podem ter entrado depois da execução anterior
         if data_inicio is None:
-            data_inicio = get_last_update_date("votacoes") or YESTERDAY
+            data_inicio = para_data(get_last_update_date("votacoes")) or yesterday()
         
         # Para incremental, usa hoje como data_fim se não for informado
         if data_fim is None:
-            data_fim = TODAY
+            data_fim = today()
     
     logger.info(f"Extracting votacoes in {mode} mode from {data_inicio} to {data_fim}")
     
     # Gera intervalos mensais para evitar limitações da API
-    data_inicio_dt = datetime.strptime(data_inicio, '%Y-%m-%d') if data_inicio else datetime(2023, 1, 1)
-    data_fim_dt = datetime.strptime(data_fim, '%Y-%m-%d') if data_fim else datetime.now()
-    
-    # Gera intervalos mensais
-    intervalos = []
-    current_date = data_inicio_dt
-    while current_date < data_fim_dt:
-        next_month = current_date.replace(day=28) + timedelta(days=4)  # Move para o próximo mês
-        next_month = next_month.replace(day=1)  # Primeiro dia do próximo mês
-        end_date = min(next_month - timedelta(days=1), data_fim_dt)  # Último dia do mês corrente ou data_fim
-        
-        intervalos.append((
-            current_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        ))
-        
-        current_date = next_month
+    intervalos = gerar_intervalos_mensais(data_inicio or date(2023, 1, 1), data_fim or date.today())
     
     # Busca dados para cada intervalo
     all_votacoes = []
     
-    for inicio, fim in tqdm(intervalos, desc="Extracting votacoes by interval"):
+    for inicio, fim in tqdm(intervalos, desc="Extracting votacoes by interval", **PROGRESS_OPTIONS):
         logger.info(f"Fetching votacoes from {inicio} to {fim}")
         
-        url = 'https://dadosabertos.camara.leg.br/api/v2/votacoes'
-        parametros = {'dataInicio': inicio, 'dataFim': fim}
-        votacoes_interval = fazer_requisicao(url, parametros)
+        votacoes_interval = requisitar_df(*montar_requisicao('votacoes', dataInicio=inicio, dataFim=fim))
         
         if votacoes_interval is not None and not votacoes_interval.empty:
             all_votacoes.append(votacoes_interval)
@@ -206,31 +501,30 @@ def extract_votacoes(mode: str = "full", data_inicio: Optional[str] = None, data
         return None
     
     # Concatena todos os intervalos
-    df_votacoes = pd.concat(all_votacoes, ignore_index=True)
+    df_votacoes = to_categories(concat_frames(all_votacoes), CATEGORY_COLUMNS['votacoes'])
     
     # Salva dados brutos em disco
     save_dataframe(df_votacoes, "votacoes")
     
     # Atualiza data da última atualização
-    update_last_update_date("votacoes", data_fim)
+    update_last_update_date("votacoes", data_fim.isoformat() if data_fim else None)
     
     return df_votacoes
 
-@task(name="Extract Votos")
-def extract_votos(df_votacoes: Optional[pd.DataFrame] = None, mode: str = "full") -> pd.DataFrame:
+def selecionar_votacoes_ids(df_votacoes: Optional[pd.DataFrame] = None, mode: str = "full") -> Optional[Any]:
     """
-    Extrai votos para cada sessão de votação.
+    Seleciona as votações cujos votos devem ser extraídos.
     
     Args:
-        df_votacoes: DataFrame com sessões de votação
+        df_votacoes: DataFrame com sessões de votação; lido do disco se None
         mode: 'full' para todas as votações, 'incremental' para votações recentes
         
     Returns:
-        DataFrame com dados dos votos
+        Array com os IDs únicos das votações, ou None se não houver votações
     """
     if df_votacoes is None:
-        # Tenta carregar do disco se não for fornecido
-        df_votacoes = load_dataframe("votacoes")
+        # Tenta carregar do disco se não for fornecido; só id e data são usados
+        df_votacoes = load_dataframe("votacoes", columns=['id', 'data'])
     
     if df_votacoes is None or df_votacoes.empty:
         logger.warning("No votacoes data available for extracting votos")
@@ -241,39 +535,95 @@ def extract_votos(df_votacoes: Optional[pd.DataFrame] = None, mode: str = "full"
         last_update = get_last_update_date("votos")
         if last_update:
             last_update_dt = datetime.strptime(last_update, '%Y-%m-%d')
-            df_votacoes = df_votacoes[pd.to_datetime(df_votacoes['data']).dt.date >= last_update_dt.date()]
-    
-    votacao_ids = df_votacoes['id'].unique().tolist()
-    logger.info(f"Extracting votos for {len(votacao_ids)} votacoes")
+            df_votacoes = df_votacoes[pd.to_datetime(df_votacoes['data'], cache=True) >= pd.Timestamp(last_update_dt.date())]
     
-    all_votos = []
+    return pd.unique(df_votacoes['id'].to_numpy())
+
+def _iterar_lotes_votos(df_votacoes: Optional[pd.DataFrame], mode: str,
+                        tamanho_lote: int) -> Iterator[pa.Table]:
+    """
+    Busca os votos em lotes de votações, gravando cada lote no arquivo bruto.
     
-    for votacao_id in tqdm(votacao_ids, desc="Extracting votos"):
-        url = f'https://dadosabertos.camara.leg.br/api/v2/votacoes/{votacao_id}/votos'
-        votos = fazer_requisicao(url)
-        
-        if votos is not None and not votos.empty:
-            votos['idVotacao'] = votacao_id
-            all_votos.append(votos)
-        else:
-            logger.warning(f"No votos found for votacao {votacao_id}")
+    Só há um lote de respostas em memória por vez. O arquivo e a data da última
+    atualização só são gravados quando todos os lotes foram consumidos.
     
-    if not all_votos:
+    Yields:
+        Tabela Arrow com os votos de cada lote que trouxe registros
+    """
+    votacao_ids = selecionar_votacoes_ids(df_votacoes, mode)
+    if votacao_ids is None:
+        return
+    logger.info(f"Extracting votos for {len(votacao_ids)} votacoes in batches of {tamanho_lote}")
+    
+    writer = ParquetChunkWriter("votos")
+    try:
+        for inicio in range(0, len(votacao_ids), tamanho_lote):
+            lote_ids = votacao_ids[inicio:inicio + tamanho_lote]
+            requisicoes = [montar_requisicao('votos_votacao', votacao_id) for votacao_id in lote_ids]
+            respostas = iterar_requisicoes_paralelas(
+                requisicoes, desc=f"Extracting votos ({inicio + len(lote_ids)}/{len(votacao_ids)})"
+            )
+            
+            tabelas = []
+            for votacao_id, resposta in zip(lote_ids, respostas):
+                votos = registros_com_id(resposta, 'idVotacao', votacao_id)
+                if votos is not None:
+                    tabelas.append(votos)
+                else:
+                    logger.warning(f"No votos found for votacao {votacao_id}")
+            
+            if tabelas:
+                lote = pa.concat_tables(tabelas, promote_options="permissive")
+                writer.write(lote)
+                yield lote
+    except BaseException:
+        writer.abort()
+        raise
+    
+    if writer.close() is None:
         logger.warning("No votos data found")
-        return None
-    
-    # Concatena todos os votos
-    df_votos = pd.concat(all_votos, ignore_index=True)
-    
-    # Salva dados brutos em disco
-    save_dataframe(df_votos, "votos")
+        return
     
     # Atualiza data da última atualização
     update_last_update_date("votos")
+
+def iterar_votos(df_votacoes: Optional[pd.DataFrame] = None, mode: str = "full",
+                 tamanho_lote: int = VOTOS_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Extrai os votos em lotes, para que cada lote seja transformado e carregado
+    antes de o próximo ser buscado (ver votos_etl).
     
-    return df_votos
+    Args:
+        df_votacoes: DataFrame com sessões de votação; lido do disco se None
+        mode: 'full' para todas as votações, 'incremental' para votações recentes
+        tamanho_lote: Quantidade de votações por lote
+        
+    Yields:
+        DataFrame com os votos de cada lote
+    """
+    for lote in _iterar_lotes_votos(df_votacoes, mode, tamanho_lote):
+        yield to_categories(lote.to_pandas(), CATEGORY_COLUMNS['votos'])
 
-@task(name="Extract Discursos")
+@task(name="Extract Votos", cache_policy=NO_CACHE)
+def extract_votos(df_votacoes: Optional[pd.DataFrame] = None, mode: str = "full") -> pd.DataFrame:
+    """
+    Extrai votos para cada sessão de votação.
+    
+    Args:
+        df_votacoes: DataFrame com sessões de votação
+        mode: 'full' para todas as votações, 'incremental' para votações recentes
+        
+    Returns:
+        DataFrame com dados dos votos
+    """
+    # Os lotes vão direto para o disco; o DataFrame completo é lido no final
+    num_votos = sum(lote.num_rows for lote in _iterar_lotes_votos(df_votacoes, mode, VOTOS_BATCH_SIZE))
+    if num_votos == 0:
+        return None
+    
+    return to_categories(load_dataframe("votos"), CATEGORY_COLUMNS['votos'])
+
+@task(name="Extract Discursos", cache_policy=NO_CACHE)
 def extract_discursos(df_deputados: Optional[pd.DataFrame] = None, mode: str = "full") -> pd.DataFrame:
     """
     Extrai discursos para cada deputado.
@@ -285,8 +635,8 @@ def extract_discursos(df_deputados: Optional[pd.DataFrame] = None, mode: str = "
         DataFrame com dados dos discursos
     """
     if df_deputados is None:
-        # Tenta carregar do disco se não for fornecido
-        df_deputados = load_dataframe("deputados")
+        # Tenta carregar do disco se não for fornecido; só id e data são usados
+        df_deputados = load_dataframe("deputados", columns=['id', 'data'])
 
     if df_deputados is None or df_deputados.empty:
         logger.warning("No deputados data available for extracting speeches")
@@ -299,32 +649,28 @@ def extract_discursos(df_deputados: Optional[pd.DataFrame] = None, mode: str = "
             last_update_dt = datetime.strptime(last_update, '%Y-%m-%d')
             # Tenta filtrar com base na data, se estiver disponível
             if 'data' in df_deputados.columns:
-                df_deputados = df_deputados[pd.to_datetime(df_deputados['data']).dt.date >= last_update_dt.date()]
+                df_deputados = df_deputados[pd.to_datetime(df_deputados['data'], cache=True) >= pd.Timestamp(last_update_dt.date())]
 
-    deputados_ids = df_deputados['id'].unique().tolist()
+    deputados_ids = pd.unique(df_deputados['id'].to_numpy())
     logger.info(f"Extracting discursos for {len(deputados_ids)} deputados")
 
-    all_discursos = []
+    requisicoes = [montar_requisicao('discursos_deputado', deputado_id) for deputado_id in deputados_ids]
+    respostas = iterar_requisicoes_paralelas(requisicoes, desc="Extracting discursos")
 
-    for deputado_id in tqdm(deputados_ids, desc="Extracting discursos"):
-        url = f'https://dadosabertos.camara.leg.br/api/v2/deputados/{deputado_id}/discursos'
-        discursos = fazer_requisicao(url)
+    def discursos_por_deputado():
+        for deputado_id, resposta in zip(deputados_ids, respostas):
+            discursos = registros_com_id(resposta, 'idDeputado', deputado_id)
+            if discursos is not None:
+                yield discursos
+            else:
+                logger.warning(f"No discursos found for deputado {deputado_id}")
 
-        if discursos is not None and not discursos.empty:
-            discursos['idDeputado'] = deputado_id
-            all_discursos.append(discursos)
-        else:
-            logger.warning(f"No discursos found for deputado {deputado_id}")
-
-    if not all_discursos:
+    # Grava os discursos em disco conforme chegam, sem acumular todas as respostas
+    if write_parquet_chunks(discursos_por_deputado(), "discursos") is None:
         logger.warning("No discursos data found")
         return None
-    
-    # Concatena todos os discursos
-    df_discursos = pd.concat(all_discursos, ignore_index=True)
 
-    # Salva dados brutos em disco
-    save_dataframe(df_discursos, "discursos")
+    df_discursos = load_dataframe("discursos")
 
     # Atualiza data da última atualização
     update_last_update_date("discursos")
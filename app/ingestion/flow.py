@@ -1,13 +1,14 @@
-import logging
 from typing import Dict, List, Optional, Any
 import argparse
-from datetime import datetime, timedelta
-from prefect import flow, get_run_logger
+from datetime import date
+from prefect import flow, task, get_run_logger
+from prefect.cache_policies import NO_CACHE
+from prefect.task_runners import ProcessPoolTaskRunner, TaskRunner, ThreadPoolTaskRunner
 
 from app.ingestion.extract import (
     extract_deputados,
     extract_votacoes,
-    extract_votos,
+    iterar_votos,
     extract_discursos
 )
 from app.ingestion.transform import (
@@ -22,26 +23,56 @@ from app.ingestion.load import (
     load_votos,
     load_discursos
 )
-from app.config import YESTERDAY, TODAY
+from app.ingestion.utils import prefetch
+from app.config import ETL_MAX_WORKERS, ETL_TASK_RUNNER, VOTOS_BATCH_SIZE
 
-@flow(name="Deputados ETL Flow")
-def deputados_etl_flow(mode: str = "full") -> Dict[str, int]:
+# Entities processed by the main flow, in dependency order
+ENTITIES = ("deputados", "votacoes", "votos", "discursos")
+
+def build_task_runner(kind: str = ETL_TASK_RUNNER, max_workers: int = ETL_MAX_WORKERS) -> TaskRunner:
+    """
+    Build the task runner for the ETL flows.
+    
+    Threads are enough while the tasks wait on the API and the database; the
+    process and Dask runners also spread the GIL-bound pandas transforms over
+    several cores, at the cost of pickling the DataFrames passed between tasks.
+    
+    Args:
+        kind: 'thread', 'process' or 'dask' (requires prefect-dask)
+        max_workers: Threads, processes or Dask workers to run tasks on
+        
+    Returns:
+        Task runner to pass to @flow
     """
-    Flow for extracting, transforming, and loading deputies data.
+    if kind == "thread":
+        return ThreadPoolTaskRunner(max_workers=max_workers)
+    if kind == "process":
+        return ProcessPoolTaskRunner(max_workers=max_workers)
+    if kind == "dask":
+        from prefect_dask import DaskTaskRunner
+        return DaskTaskRunner(cluster_kwargs={"n_workers": max_workers, "threads_per_worker": 1})
+    raise ValueError(f"Unknown task runner '{kind}', expected 'thread', 'process' or 'dask'")
+
+@task(name="Deputados ETL", cache_policy=NO_CACHE)
+def deputados_etl(mode: str = "full", df_deputados: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Task for extracting, transforming, and loading deputies data.
     Uses a unified approach that treats basic and detailed data as a single entity.
     
     Args:
         mode: 'full' for full extraction, 'incremental' for incremental
+        df_deputados: Already extracted deputies; extracted here when None
         
     Returns:
         Statistics about the ETL process
     """
     logger = get_run_logger()
-    logger.info(f"Starting deputados ETL flow in {mode} mode")
+    logger.info(f"Starting deputados ETL in {mode} mode")
     
     # Extract - unified extraction directly from detailed endpoint
-    logger.info("Starting extraction phase for deputados")
-    df_deputados = extract_deputados(mode=mode)
+    if df_deputados is None:
+        logger.info("Starting extraction phase for deputados")
+        df_deputados = extract_deputados(mode=mode)
     
     if df_deputados is None or df_deputados.empty:
         logger.warning("No deputados data extracted")
@@ -62,34 +93,39 @@ def deputados_etl_flow(mode: str = "full") -> Dict[str, int]:
         "deputados_loaded": num_loaded
     }
     
-    logger.info(f"Deputados ETL flow completed with stats: {stats}")
+    logger.info(f"Deputados ETL completed with stats: {stats}")
     return stats
 
-@flow(name="Votacoes ETL Flow")
-def votacoes_etl_flow(mode: str = "full", 
-                     data_inicio: Optional[str] = None, 
-                     data_fim: Optional[str] = None) -> Dict[str, int]:
+@task(name="Votacoes ETL", cache_policy=NO_CACHE)
+def votacoes_etl(mode: str = "full", 
+                 data_inicio: Optional[date] = None, 
+                 data_fim: Optional[date] = None,
+                 df_votacoes: Optional[Any] = None) -> Dict[str, int]:
     """
-    Flow for extracting, transforming, and loading voting sessions data.
+    Task for extracting, transforming, and loading voting sessions data.
     
     Args:
         mode: 'full' for full extraction, 'incremental' for incremental
-        data_inicio: Start date for extraction (format: YYYY-MM-DD)
-        data_fim: End date for extraction (format: YYYY-MM-DD)
+        data_inicio: Start date for extraction
+        data_fim: End date for extraction (inclusive)
+        df_votacoes: Already extracted voting sessions; extracted here when None
         
     Returns:
         Statistics about the ETL process
     """
     logger = get_run_logger()
-    if mode == "incremental" and data_inicio is None:
-        data_inicio = YESTERDAY
-        data_fim = TODAY
-        
-    logger.info(f"Starting votacoes ETL flow in {mode} mode from {data_inicio} to {data_fim}")
+    # In incremental mode a missing window is resolved by extract_votacoes from the
+    # last update date (falling back to yesterday)
+    logger.info(f"Starting votacoes ETL in {mode} mode from {data_inicio} to {data_fim}")
     
     # Extract
-    logger.info("Starting extraction phase for votacoes")
-    df_votacoes = extract_votacoes(mode=mode, data_inicio=data_inicio, data_fim=data_fim)
+    if df_votacoes is None:
+        logger.info("Starting extraction phase for votacoes")
+        df_votacoes = extract_votacoes(mode=mode, data_inicio=data_inicio, data_fim=data_fim)
+    
+    if df_votacoes is None or df_votacoes.empty:
+        logger.warning("No votacoes data extracted")
+        return {"votacoes_extracted": 0, "votacoes_loaded": 0}
     
     # Transform
     logger.info("Starting transformation phase for votacoes")
@@ -104,62 +140,84 @@ def votacoes_etl_flow(mode: str = "full",
         "votacoes_loaded": num_loaded
     }
     
-    logger.info(f"Votacoes ETL flow completed with stats: {stats}")
+    logger.info(f"Votacoes ETL completed with stats: {stats}")
     return stats
 
-@flow(name="Votos ETL Flow")
-def votos_etl_flow(mode: str = "full", df_votacoes: Optional[Any] = None) -> Dict[str, int]:
+@task(name="Votos ETL", cache_policy=NO_CACHE)
+def votos_etl(mode: str = "full", df_votacoes: Optional[Any] = None,
+              df_votos: Optional[Any] = None) -> Dict[str, int]:
     """
-    Flow for extracting, transforming, and loading votes data.
+    Task for extracting, transforming, and loading votes data.
+    
+    Unless df_votos is given, votes are processed in batches of VOTOS_BATCH_SIZE
+    voting sessions: each batch is transformed and loaded while the next one is
+    being fetched, so only a couple of batches are held in memory.
     
     Args:
         mode: 'full' for full extraction, 'incremental' for incremental
         df_votacoes: DataFrame with voting sessions from previous task
+        df_votos: Already extracted votes; processed in a single batch when given
         
     Returns:
         Statistics about the ETL process
     """
     logger = get_run_logger()
-    logger.info(f"Starting votos ETL flow in {mode} mode")
-    
-    # Extract
-    logger.info("Starting extraction phase for votos")
-    df_votos = extract_votos(df_votacoes=df_votacoes, mode=mode)
-    
-    # Transform
-    logger.info("Starting transformation phase for votos")
-    df_votos_clean = transform_votos(df_votos=df_votos)
-    
-    # Load
-    logger.info("Starting loading phase for votos")
-    num_loaded = load_votos(df_votos_clean=df_votos_clean)
+    logger.info(f"Starting votos ETL in {mode} mode")
+    
+    if df_votos is not None:
+        batches = [df_votos] if not df_votos.empty else []
+    else:
+        logger.info(f"Starting batched extraction of votos ({VOTOS_BATCH_SIZE} votacoes per batch)")
+        batches = prefetch(iterar_votos(df_votacoes=df_votacoes, mode=mode))
+    
+    num_extracted = 0
+    num_loaded = 0
+    for df_batch in batches:
+        num_extracted += len(df_batch)
+        
+        # Transform
+        logger.info(f"Starting transformation phase for {len(df_batch)} votos")
+        df_votos_clean = transform_votos(df_votos=df_batch)
+        if df_votos_clean is None:
+            continue
+        
+        # Load
+        logger.info("Starting loading phase for votos")
+        num_loaded += load_votos(df_votos_clean=df_votos_clean)
     
     stats = {
-        "votos_extracted": len(df_votos) if df_votos is not None else 0,
+        "votos_extracted": num_extracted,
         "votos_loaded": num_loaded
     }
     
-    logger.info(f"Votos ETL flow completed with stats: {stats}")
+    logger.info(f"Votos ETL completed with stats: {stats}")
     return stats
 
-@flow(name="Discursos ETL Flow")
-def discursos_etl_flow(mode: str = "full", df_deputados: Optional[Any] = None) -> Dict[str, int]:
+@task(name="Discursos ETL", cache_policy=NO_CACHE)
+def discursos_etl(mode: str = "full", df_deputados: Optional[Any] = None,
+                  df_discursos: Optional[Any] = None) -> Dict[str, int]:
     """
-    Flow for extracting, transforming, and loading speeches data.
+    Task for extracting, transforming, and loading speeches data.
     
     Args:
         mode: 'full' for full extraction, 'incremental' for incremental
         df_deputados: DataFrame with deputies from previous task
+        df_discursos: Already extracted speeches; extracted here when None
         
     Returns:
         Statistics about the ETL process
     """
     logger = get_run_logger()
-    logger.info(f"Starting discursos ETL flow in {mode} mode")
+    logger.info(f"Starting discursos ETL in {mode} mode")
     
     # Extract
-    logger.info("Starting extraction phase for discursos")
-    df_discursos = extract_discursos(df_deputados=df_deputados, mode=mode)
+    if df_discursos is None:
+        logger.info("Starting extraction phase for discursos")
+        df_discursos = extract_discursos(df_deputados=df_deputados, mode=mode)
+    
+    if df_discursos is None or df_discursos.empty:
+        logger.warning("No discursos data extracted")
+        return {"discursos_extracted": 0, "discursos_loaded": 0}
     
     # Transform
     logger.info("Starting transformation phase for discursos")
@@ -174,90 +232,142 @@ def discursos_etl_flow(mode: str = "full", df_deputados: Optional[Any] = None) -
         "discursos_loaded": num_loaded
     }
     
-    logger.info(f"Discursos ETL flow completed with stats: {stats}")
+    logger.info(f"Discursos ETL completed with stats: {stats}")
     return stats
 
-@flow(name="Camara Analytics ETL Flow")
+def _submit_entities(entities: tuple, mode: str, data_inicio: Optional[date],
+                     data_fim: Optional[date]) -> Dict[str, Dict[str, int]]:
+    """
+    Submit the ETL of the given entities and wait for their statistics.
+    
+    Must be called from inside a flow.
+    
+    Args:
+        entities: Entities to process, a subset of ENTITIES
+        mode: 'full' for full extraction, 'incremental' for incremental
+        data_inicio: Start date for extraction
+        data_fim: End date for extraction (inclusive)
+        
+    Returns:
+        Statistics of each entity processed
+    """
+    # Extract up front so the API-bound extractions run concurrently; discursos
+    # only waits for deputados. Votos are extracted in batches by their own task
+    deputados_future = extract_deputados.submit(mode=mode) if "deputados" in entities else None
+    votacoes_future = None
+    if "votacoes" in entities:
+        votacoes_future = extract_votacoes.submit(mode=mode, data_inicio=data_inicio, data_fim=data_fim)
+    discursos_future = None
+    if "discursos" in entities:
+        # Without deputados in this run, extract_discursos reads them from disk
+        discursos_future = extract_discursos.submit(df_deputados=deputados_future, mode=mode)
+    
+    # Transform and load as soon as inputs are ready: deputados and votacoes load
+    # in parallel, discursos waits for deputados and votos for both (load_votos
+    # drops votes whose deputado is not in the database yet)
+    loads = {}
+    if deputados_future is not None:
+        loads["deputados"] = deputados_etl.submit(mode=mode, df_deputados=deputados_future)
+    
+    if votacoes_future is not None:
+        loads["votacoes"] = votacoes_etl.submit(mode=mode, data_inicio=data_inicio,
+                                                data_fim=data_fim, df_votacoes=votacoes_future)
+    
+    if "votos" in entities:
+        # Without votacoes in this run, votos_etl reads them from disk
+        loads["votos"] = votos_etl.submit(
+            mode=mode, df_votacoes=votacoes_future,
+            wait_for=[loads[entity] for entity in ("deputados", "votacoes") if entity in loads]
+        )
+    
+    if discursos_future is not None:
+        loads["discursos"] = discursos_etl.submit(
+            mode=mode, df_discursos=discursos_future,
+            wait_for=[loads["deputados"]] if "deputados" in loads else []
+        )
+    
+    return {entity: future.result() for entity, future in loads.items()}
+
+# The loads running in one process share its SQLAlchemy pool
+# (app.database.database.get_engine), created on first use in each worker process
+@flow(name="Camara Analytics ETL Flow", task_runner=build_task_runner())
 def camara_analytics_etl_flow(
     mode: str = "full",
-    entities: List[str] = None,
-    data_inicio: Optional[str] = None,
-    data_fim: Optional[str] = None
+    entities: Optional[List[str]] = None,
+    data_inicio: Optional[date] = None,
+    data_fim: Optional[date] = None
 ) -> Dict[str, Dict[str, int]]:
     """
     Main flow for the Camara Analytics ETL process.
     
     Args:
         mode: 'full' for full extraction, 'incremental' for incremental
-        entities: List of entities to process ('deputados', 'votacoes', 'votos'), None for all
-        data_inicio: Start date for extraction (format: YYYY-MM-DD)
-        data_fim: End date for extraction (format: YYYY-MM-DD)
+        entities: Entities to process (see ENTITIES, case-insensitive), None or 'all' for all
+        data_inicio: Start date for extraction
+        data_fim: End date for extraction (inclusive)
         
     Returns:
         Combined statistics from all flows
     """
-    if entities is None:
-        entities = ["deputados", "votacoes", "votos", "discursos"]
-    elif isinstance(entities, str):
-        if entities.lower() == "all":
-            entities = ["deputados", "votacoes", "votos", "discursos"] 
-        else:
-            entities = [entities]
-    
     logger = get_run_logger()
-    logger.info(f"Starting Camara Analytics ETL flow in {mode} mode for entities: {entities}")
     
-    stats = {}
+    # The scheduled runs pass no selection, so there is nothing to normalize
+    if entities is None:
+        selected = ENTITIES
+    else:
+        if isinstance(entities, str):
+            entities = [entities]
+        entities = frozenset(entity.lower() for entity in entities)
+        if "all" in entities:
+            entities = frozenset(ENTITIES)
+        
+        unknown = entities - set(ENTITIES)
+        if unknown:
+            logger.warning(f"Ignoring unknown entities: {sorted(unknown)}")
+        selected = tuple(entity for entity in ENTITIES if entity in entities)
     
-    # Process deputies
-    if "deputados" in entities:
-        stats["deputados"] = deputados_etl_flow(mode=mode)
+    logger.info(f"Starting Camara Analytics ETL flow in {mode} mode for entities: {list(selected)}")
     
-    # Process voting sessions
-    if "votacoes" in entities:
-        stats["votacoes"] = votacoes_etl_flow(mode=mode, data_inicio=data_inicio, data_fim=data_fim)
+    stats = _submit_entities(selected, mode, data_inicio, data_fim)
     
-    # Process votes (depends on voting sessions)
-    if "votos" in entities:
-        # If we processed votacoes, we can pass the DataFrame directly
-        df_votacoes = None if "votacoes" not in entities else extract_votacoes.fn(mode=mode, data_inicio=data_inicio, data_fim=data_fim)
-        stats["votos"] = votos_etl_flow(mode=mode, df_votacoes=df_votacoes)
-    
-    if "discursos" in entities:
-        # If we processed deputados, we can pass the DataFrame directly
-        # Carrega do disco em vez de reutilizar o DataFrame anterior, pois extract_deputados agora retorna detalhes
-        df_deputados = None
-        if "deputados" in entities:
-            # Carrega os dados básicos de deputados do disco
-            from app.ingestion.utils import load_dataframe
-            df_deputados = load_dataframe("deputados")
-        
-        stats["discursos"] = discursos_etl_flow(mode=mode, df_deputados=df_deputados)
-
     logger.info(f"Camara Analytics ETL flow completed with stats: {stats}")
     return stats
 
+def run_etl(mode: str = "full", entities: Optional[List[str]] = None,
+            data_inicio: Optional[date] = None,
+            data_fim: Optional[date] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Run the ETL flow.
+    
+    Args:
+        mode: 'full' for full extraction, 'incremental' for incremental
+        entities: Entities to process, None for all
+        data_inicio: Start date for extraction
+        data_fim: End date for extraction (inclusive)
+        
+    Returns:
+        Combined statistics from all flows
+    """
+    return camara_analytics_etl_flow(mode=mode, entities=entities,
+                                     data_inicio=data_inicio, data_fim=data_fim)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run the Camara Analytics ETL process")
     parser.add_argument("--mode", type=str, choices=["full", "incremental"], default="incremental",
                         help="ETL mode (full or incremental)")
     parser.add_argument("--entity", type=str, default="all",
                         help="Entity to process (deputados, votacoes, votos, or all)")
-    parser.add_argument("--start-date", type=str, default=None,
+    parser.add_argument("--start-date", type=date.fromisoformat, default=None,
                         help="Start date for extraction (YYYY-MM-DD)")
-    parser.add_argument("--end-date", type=str, default=None,
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
                         help="End date for extraction (YYYY-MM-DD)")
     
     args = parser.parse_args()
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    # Logging is configured by app.ingestion.utils (queued file and console handlers)
     
     # Run the flow
-    results = camara_analytics_etl_flow(
+    results = run_etl(
         mode=args.mode,
         entities=[args.entity] if args.entity != "all" else None,
         data_inicio=args.start_date,
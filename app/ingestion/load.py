@@ -1,40 +1,274 @@
+import io
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from prefect import task
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session, sessionmaker
+from prefect.cache_policies import NO_CACHE
+from sqlalchemy import JSON, Table, any_, bindparam, event, insert, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from app.database.models import Deputado, Votacao, Voto, Discurso
-from app.config import DATABASE_URL
-from app.ingestion.utils import load_dataframe, commit_to_db
+from app.config import LOAD_SYNCHRONOUS_COMMIT
+from app.database.database import get_session_factory
+from app.database.models import Deputado, Votacao, Discurso, TIPOS_VOTO
+from app.ingestion.utils import load_dataframe
 from app.ingestion.transform import (
-    transform_deputado,
-    transform_votacao,
-    transform_voto,
-    transform_discurso
+    deputado_record,
+    votacao_record,
+    discurso_record,
+    resolve_fields
 )
 
 logger = logging.getLogger(__name__)
 
-def get_db_session() -> Tuple[Session, Any]:
+# Number of rows sent per multi-row INSERT statement
+BULK_CHUNK_SIZE = 5000
+
+# Number of rows serialized and sent per COPY, bounding the size of the CSV buffer
+COPY_CHUNK_SIZE = 10000
+
+# PostgreSQL's limit on bind parameters in one statement (the wire protocol counts them in 16 bits)
+MAX_BIND_PARAMS = 65535
+
+# Columns of each processed DataFrame that map to the target table's unique key
+UNIQUE_KEY_COLUMNS = {
+    "deputados": ["id"],
+    "votacoes": ["id"],
+    "votos": ["idVotacao", "deputadoId"],
+}
+
+def _set_synchronous_commit(session: Session, transaction, connection) -> None:
+    """Apply LOAD_SYNCHRONOUS_COMMIT to the transaction that just began."""
+    connection.execute(
+        text("SELECT set_config('synchronous_commit', :value, true)"),
+        {"value": LOAD_SYNCHRONOUS_COMMIT}
+    )
+
+def get_db_session() -> Session:
     """
     Create a database session.
     
+    Sessions come from the process-wide engine in app.database.database, so all
+    loads (including concurrent ones) reuse its connection pool instead of
+    connecting from scratch. When LOAD_SYNCHRONOUS_COMMIT is set (it is empty
+    by default, keeping the server setting), every transaction of the session
+    starts with it; the setting is transaction-local (SET LOCAL), so it also
+    works through PgBouncer and never leaks into pooled connections.
+    
     Returns:
-        Tuple with session and engine
+        New session; close it to return the connection to the pool
     """
     try:
-        engine = create_engine(DATABASE_URL)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        session = SessionLocal()
-        return session, engine
+        db = get_session_factory()()
     except Exception as e:
         logger.error(f"Error creating database session: {e}")
         raise
+    if LOAD_SYNCHRONOUS_COMMIT:
+        event.listen(db, "after_begin", _set_synchronous_commit)
+    return db
+
+def drop_duplicate_keys(df: pd.DataFrame, entity: str) -> pd.DataFrame:
+    """
+    Drop rows repeating a unique key (see UNIQUE_KEY_COLUMNS), keeping the last one.
+    
+    Duplicates would otherwise cost an extra index probe each, or make the
+    whole COPY fail.
+    
+    Args:
+        df: Processed DataFrame
+        entity: Key of UNIQUE_KEY_COLUMNS
+        
+    Returns:
+        DataFrame with one row per key
+    """
+    df_unique = df.drop_duplicates(subset=UNIQUE_KEY_COLUMNS[entity], keep="last")
+    if len(df_unique) < len(df):
+        logger.info(f"Dropped {len(df) - len(df_unique)} duplicate {entity} rows")
+    return df_unique
+
+def rows_per_statement(table: Table, chunk_size: int) -> int:
+    """Cap a multi-row VALUES chunk so one statement stays within MAX_BIND_PARAMS."""
+    return max(1, min(chunk_size, MAX_BIND_PARAMS // len(table.columns)))
+
+def select_by_keys(db: Session, stmt, column, keys) -> list:
+    """
+    Run a SELECT restricted to the rows whose `column` is in `keys`.
+    
+    Looks up only the keys of the batch being loaded with one indexed
+    `column = ANY(:keys)` query, instead of reading the whole table. The keys
+    travel as a single array parameter, so the batch size is not bounded by the
+    bind parameter limit and the statement text is the same for every batch.
+    
+    Args:
+        db: Database session
+        stmt: SELECT statement to restrict
+        column: Column compared against the keys
+        keys: Candidate key values (Python scalars)
+        
+    Returns:
+        Result rows
+    """
+    keys_param = bindparam("keys", value=list(keys), type_=ARRAY(column.type))
+    return db.execute(stmt.where(column == any_(keys_param))).all()
+
+def bulk_insert(db: Session, model, records: List[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """
+    Insert records with executemany batches, bypassing the ORM unit of work.
+    
+    Each chunk is one executemany of a Core INSERT, which SQLAlchemy sends as
+    multi-row INSERT ... VALUES pages (insertmanyvalues).
+    
+    Args:
+        db: Database session
+        model: Mapped class of the target table
+        records: List of dicts keyed by column name
+        chunk_size: Number of rows per batch
+        
+    Returns:
+        Number of records inserted
+    """
+    for start in range(0, len(records), chunk_size):
+        db.execute(insert(model.__table__), records[start:start + chunk_size])
+    return len(records)
+
+def bulk_update(db: Session, model, records: List[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """
+    Update rows by primary key with executemany batches, bypassing the ORM unit of work.
+    
+    Each chunk is one ORM bulk UPDATE by primary key (an executemany of
+    UPDATE ... WHERE id = ...).
+    
+    Args:
+        db: Database session
+        model: Mapped class of the target table
+        records: List of dicts keyed by column name, including the primary key
+        chunk_size: Number of rows per batch
+        
+    Returns:
+        Number of records sent to the database
+    """
+    for start in range(0, len(records), chunk_size):
+        db.execute(update(model), records[start:start + chunk_size])
+    return len(records)
+
+def upsert_records(db: Session, table: Table, records: List[Dict[str, Any]], 
+                   index_elements: List[str], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+    """
+    Insert records with INSERT ... ON CONFLICT DO UPDATE in multi-row batches.
+    
+    Args:
+        db: Database session
+        table: Target table
+        records: List of dicts keyed by column name
+        index_elements: Columns of the unique constraint used for conflict detection
+        chunk_size: Number of rows per statement, lowered to fit MAX_BIND_PARAMS
+        
+    Returns:
+        Number of records sent to the database
+    """
+    # A statement can't update the same row twice; the last record for a key wins
+    records = list({tuple(record[key] for key in index_elements): record for record in records}.values())
+    chunk_size = rows_per_statement(table, chunk_size)
+    for start in range(0, len(records), chunk_size):
+        stmt = pg_insert(table).values(records[start:start + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={c.name: stmt.excluded[c.name] for c in table.columns if c.name not in index_elements}
+        )
+        db.execute(stmt)
+    return len(records)
+
+def dataframe_to_csv_buffer(df: pd.DataFrame) -> io.BytesIO:
+    """
+    Serialize a DataFrame to headerless CSV for COPY.
+    
+    Uses the multi-threaded Arrow CSV writer, which works on columnar buffers
+    instead of formatting each cell in Python. Falls back to pandas when the
+    frame has mixed-type object columns Arrow can't convert.
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        Buffer positioned at the start of the CSV data
+    """
+    buffer = io.BytesIO()
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, buffer, write_options=pa_csv.WriteOptions(include_header=False))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        logger.debug(f"Arrow CSV serialization failed, using pandas: {e}")
+        buffer = io.BytesIO(df.to_csv(index=False, header=False).encode("utf-8"))
+    buffer.seek(0)
+    return buffer
+
+def copy_dataframe(db: Session, df: pd.DataFrame, table_name: str, columns: List[str],
+                   chunk_size: int = COPY_CHUNK_SIZE) -> int:
+    """
+    Bulk load a DataFrame into a table using PostgreSQL COPY FROM STDIN.
+    
+    The COPY runs on the session's own connection, inside its current
+    transaction; the caller commits or rolls back together with the rest
+    of the load. Rows are serialized and sent one chunk at a time, so only
+    one chunk's CSV is held in memory.
+    
+    Args:
+        db: Database session
+        df: DataFrame whose columns are in the same order as `columns`
+        table_name: Target table
+        columns: Target column names
+        chunk_size: Number of rows per COPY
+        
+    Returns:
+        Number of rows copied
+    """
+    copy_sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH CSV"
+    cursor = db.connection().connection.cursor()
+    try:
+        for start in range(0, len(df), chunk_size):
+            cursor.copy_expert(copy_sql, dataframe_to_csv_buffer(df.iloc[start:start + chunk_size]))
+    finally:
+        cursor.close()
+    return len(df)
+
+def copy_records(db: Session, table: Table, records: List[Dict[str, Any]],
+                 chunk_size: int = COPY_CHUNK_SIZE) -> int:
+    """
+    Bulk insert column mappings with COPY FROM STDIN (see copy_dataframe).
+    
+    All records must have the same keys. JSON columns are serialized here,
+    since COPY reads them as text. Records are framed and serialized one
+    chunk at a time, so only one chunk's copy of large text columns is held
+    besides the records themselves.
+    
+    Args:
+        db: Database session
+        table: Target table
+        records: List of dicts keyed by column name
+        chunk_size: Number of rows per COPY
+        
+    Returns:
+        Number of rows copied
+    """
+    columns = list(records[0])
+    json_columns = [column for column in columns if isinstance(table.columns[column].type, JSON)]
+    num_copied = 0
+    for start in range(0, len(records), chunk_size):
+        df = pd.DataFrame.from_records(records[start:start + chunk_size], columns=columns)
+        for column in json_columns:
+            df[column] = [
+                None if value is None or value is pd.NA else orjson.dumps(value).decode()
+                for value in df[column]
+            ]
+        num_copied += copy_dataframe(db, df, table.name, columns)
+    return num_copied
 
-@task(name="Load Deputados", retries=3, retry_delay_seconds=30)
+@task(name="Load Deputados", cache_policy=NO_CACHE, retries=3, retry_delay_seconds=30)
 def load_deputados(df_deputados_clean: Optional[pd.DataFrame] = None) -> int:
     """
     Load deputies data into the database. Adds new records and updates existing ones.
@@ -52,35 +286,28 @@ def load_deputados(df_deputados_clean: Optional[pd.DataFrame] = None) -> int:
         logger.warning("No processed deputados data available for loading")
         return 0
     
+    df_deputados_clean = drop_duplicate_keys(df_deputados_clean, "deputados")
     logger.info(f"Loading {len(df_deputados_clean)} deputados into database")
     
     # Get database session
     try:
-        db, engine = get_db_session()
+        db = get_db_session()
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return 0
     
     try:
-        # Transform DataFrame records to list of SQLAlchemy models
-        deputados_to_load = []
-        for _, row in df_deputados_clean.iterrows():
+        # Transform DataFrame records to column mappings
+        records = []
+        fields = resolve_fields('deputados', df_deputados_clean.columns)
+        for row_dict in df_deputados_clean.to_dict(orient="records"):
             try:
-                row_dict = row.to_dict()
-                deputado = transform_deputado(row_dict)
-                deputados_to_load.append(deputado)
+                records.append(deputado_record(row_dict, fields))
             except Exception as e:
-                logger.error(f"Error transforming deputado record {row.get('id', 'unknown')}: {e}")
+                logger.error(f"Error transforming deputado record {row_dict.get('id', 'unknown')}: {e}")
         
-        # Use SQLAlchemy's merge operation for each record
-        # This will update existing records and create new ones
-        num_loaded = 0
-        for deputado in deputados_to_load:
-            try:
-                db.merge(deputado)  # Updates if exists, inserts if new
-                num_loaded += 1
-            except Exception as e:
-                logger.error(f"Error merging deputado {deputado.id}: {e}")
+        # Upsert in batches: updates existing records and creates new ones
+        num_loaded = upsert_records(db, Deputado.__table__, records, index_elements=["id"])
         
         # Commit all changes
         db.commit()
@@ -95,9 +322,8 @@ def load_deputados(df_deputados_clean: Optional[pd.DataFrame] = None) -> int:
     
     finally:
         db.close()
-        engine.dispose()
 
-@task(name="Load Votacoes", retries=3, retry_delay_seconds=30)
+@task(name="Load Votacoes", cache_policy=NO_CACHE, retries=3, retry_delay_seconds=30)
 def load_votacoes(df_votacoes_clean: Optional[pd.DataFrame] = None) -> int:
     """
     Load voting sessions data into the database.
@@ -115,96 +341,37 @@ def load_votacoes(df_votacoes_clean: Optional[pd.DataFrame] = None) -> int:
         logger.warning("No processed votacoes data available for loading")
         return 0
     
+    # Ensure id is a string, once for the whole column
+    df_votacoes_clean = df_votacoes_clean.assign(id=df_votacoes_clean['id'].astype(str))
+    df_votacoes_clean = drop_duplicate_keys(df_votacoes_clean, "votacoes")
     logger.info(f"Loading {len(df_votacoes_clean)} votacoes into database")
     
     # Get database session
     try:
-        db, engine = get_db_session()
+        db = get_db_session()
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return 0
     
-    num_new = 0
-    num_updated = 0
-    
     try:
-        # First, determine which voting sessions are new (not in the database)
-        existing_ids_query = text("SELECT id FROM votacoes")
-        try:
-            existing_ids = {row[0] for row in db.execute(existing_ids_query)}
-        except SQLAlchemyError as e:
-            logger.error(f"Error querying existing votacoes: {e}")
-            existing_ids = set()
-        
-        # Get the list of all IDs from the DataFrame - ensure they're strings
-        all_ids = set(df_votacoes_clean['id'].astype(str).unique())
-        
-        # Determine new and existing voting sessions
-        new_ids = all_ids - existing_ids
-        existing_ids_to_update = all_ids & existing_ids
-        
-        logger.info(f"Found {len(new_ids)} new votacoes and {len(existing_ids_to_update)} existing votacoes to update")
-        
-        # Process for insertion/update
-        votacoes_to_add = []
-        
-        # Add new voting sessions
-        for _, row in df_votacoes_clean[df_votacoes_clean['id'].astype(str).isin(new_ids)].iterrows():
+        # Transform DataFrame records to column mappings
+        votacoes_to_load = []
+        fields = resolve_fields('votacoes', df_votacoes_clean.columns)
+        for row_dict in df_votacoes_clean.to_dict(orient="records"):
             try:
-                row_dict = row.to_dict()
-                # Ensure id is a string
-                row_dict['id'] = str(row_dict['id'])
-                votacao = transform_votacao(row_dict)
-                votacoes_to_add.append(votacao)
+                votacoes_to_load.append(votacao_record(row_dict, fields))
             except Exception as e:
-                logger.error(f"Error processing votacao {row.get('id', 'unknown')}: {e}")
+                logger.error(f"Error processing votacao {row_dict.get('id', 'unknown')}: {e}")
         
-        # Update existing voting sessions
-        for _, row in df_votacoes_clean[df_votacoes_clean['id'].astype(str).isin(existing_ids_to_update)].iterrows():
-            try:
-                row_dict = row.to_dict()
-                # Ensure id is a string
-                row_id = str(row_dict['id'])
-                
-                # Get the existing voting session from the database
-                existing_votacao = db.query(Votacao).filter(Votacao.id == row_id).first()
-                
-                if existing_votacao:
-                    # Update fields
-                    existing_votacao.uri = row_dict.get('uri', existing_votacao.uri)
-                    existing_votacao.data = row_dict.get('data', existing_votacao.data)
-                    existing_votacao.data_hora_registro = row_dict.get('dataHoraRegistro', existing_votacao.data_hora_registro)
-                    existing_votacao.sigla_orgao = row_dict.get('siglaOrgao', existing_votacao.sigla_orgao)
-                    existing_votacao.uri_orgao = row_dict.get('uriOrgao', existing_votacao.uri_orgao)
-                    existing_votacao.proposicao_objeto = row_dict.get('proposicaoObjeto', existing_votacao.proposicao_objeto)
-                    existing_votacao.tipo_votacao = row_dict.get('tipoVotacao', existing_votacao.tipo_votacao)
-                    existing_votacao.ultima_apresentacao_proposicao = row_dict.get('ultimaApresentacaoProposicao', existing_votacao.ultima_apresentacao_proposicao)
-                    existing_votacao.aprovacao = row_dict.get('aprovacao', existing_votacao.aprovacao)
-                    num_updated += 1
-            except Exception as e:
-                logger.error(f"Error updating votacao {row.get('id', 'unknown')}: {e}")
+        # Upsert in batches: PostgreSQL resolves new vs existing voting sessions
+        # against the primary key, so no existence lookup is needed
+        num_loaded = upsert_records(db, Votacao.__table__, votacoes_to_load, index_elements=["id"])
         
-        # Commit new voting sessions to database
-        try:
-            num_new = commit_to_db(db, votacoes_to_add, "votacoes (new)")
-            db.commit()  # Commit updates
-        except IntegrityError as e:
-            db.rollback()
-            logger.error(f"Integrity error loading votacoes: {e}")
-            # Try inserting one by one to salvage what we can
-            num_new = 0
-            for votacao in votacoes_to_add:
-                try:
-                    db.add(votacao)
-                    db.commit()
-                    num_new += 1
-                except IntegrityError:
-                    db.rollback()
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error committing votacoes: {e}")
+        # Commit all changes
+        db.commit()
         
-        return num_new + num_updated
+        logger.info(f"Successfully loaded {num_loaded} votacoes")
+        return num_loaded
     
     except Exception as e:
         db.rollback()
@@ -212,9 +379,8 @@ def load_votacoes(df_votacoes_clean: Optional[pd.DataFrame] = None) -> int:
         return 0
     finally:
         db.close()
-        engine.dispose()
 
-@task(name="Load Votos", retries=3, retry_delay_seconds=30)
+@task(name="Load Votos", cache_policy=NO_CACHE, retries=3, retry_delay_seconds=30)
 def load_votos(df_votos_clean: Optional[pd.DataFrame] = None) -> int:
     """
     Load votes data into the database.
@@ -236,133 +402,89 @@ def load_votos(df_votos_clean: Optional[pd.DataFrame] = None) -> int:
     
     # Get database session
     try:
-        db, engine = get_db_session()
+        db = get_db_session()
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return 0
     
     try:
-        # Check if we have the necessary foreign keys in the database
-        votacao_ids = set(df_votos_clean['idVotacao'].astype(str).unique())
-        
         # Filter out rows with missing or invalid deputado IDs
-        df_votos_clean = df_votos_clean.dropna(subset=['deputadoId'])
-        try:
-            df_votos_clean['deputadoId'] = df_votos_clean['deputadoId'].astype(int)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error converting deputadoId to int: {e}")
-            # Try to salvage valid IDs
-            valid_ids = []
-            for idx, row in df_votos_clean.iterrows():
-                try:
-                    row['deputadoId'] = int(row['deputadoId'])
-                    valid_ids.append(idx)
-                except (ValueError, TypeError):
-                    pass
-            df_votos_clean = df_votos_clean.loc[valid_ids]
+        deputado_ids_numeric = pd.to_numeric(df_votos_clean['deputadoId'], errors='coerce')
+        num_invalid = int(deputado_ids_numeric.isna().sum() - df_votos_clean['deputadoId'].isna().sum())
+        if num_invalid:
+            logger.warning(f"Dropping {num_invalid} votos with non-numeric deputadoId")
+        df_votos_clean = df_votos_clean.assign(deputadoId=deputado_ids_numeric).dropna(subset=['deputadoId'])
+        df_votos_clean['deputadoId'] = df_votos_clean['deputadoId'].astype('int64')
         
         if df_votos_clean.empty:
             logger.warning("No valid votos data after filtering for valid deputado IDs")
             return 0
         
-        deputado_ids = set(df_votos_clean['deputadoId'].astype(int).unique())
-        
-        # Verify votacao_ids exist in database
-        db_votacao_ids_query = text("SELECT id FROM votacoes")
-        try:
-            db_votacao_ids = {str(row[0]) for row in db.execute(db_votacao_ids_query)}
-        except SQLAlchemyError as e:
-            logger.error(f"Error querying votacao IDs: {e}")
-            db_votacao_ids = set()
-        
-        missing_votacao_ids = votacao_ids - db_votacao_ids
-        
-        # Verify deputado_ids exist in database
-        db_deputado_ids_query = text("SELECT id FROM deputados")
-        try:
-            db_deputado_ids = {row[0] for row in db.execute(db_deputado_ids_query)}
-        except SQLAlchemyError as e:
-            logger.error(f"Error querying deputado IDs: {e}")
-            db_deputado_ids = set()
-        
-        missing_deputado_ids = deputado_ids - db_deputado_ids
-        
-        if missing_votacao_ids:
-            logger.warning(f"Found {len(missing_votacao_ids)} votacao IDs not in the database")
-        
-        if missing_deputado_ids:
-            logger.warning(f"Found {len(missing_deputado_ids)} deputado IDs not in the database")
-        
-        # Filter out votes with missing foreign keys
-        valid_df = df_votos_clean[
-            (df_votos_clean['idVotacao'].astype(str).isin(db_votacao_ids)) & 
-            (df_votos_clean['deputadoId'].astype(int).isin(db_deputado_ids))
-        ]
-        
-        if valid_df.empty:
-            logger.warning("No valid votos to load after filtering for existing foreign keys")
-            return 0
-        
-        logger.info(f"Loading {len(valid_df)} valid votos after filtering")
-        
-        # Find existing votes to avoid duplicates
-        # Create a composite key of votacao_id and deputado_id for comparison
-        valid_df['composite_key'] = valid_df.apply(
-            lambda row: f"{row['idVotacao']}_{row['deputadoId']}", 
-            axis=1
-        )
-        
-        # Query for existing composite keys
-        try:
-            existing_votos_query = text("""
-                SELECT CONCAT(votacao_id, '_', deputado_id) as composite_key
-                FROM votos
-            """)
-            existing_keys = {row[0] for row in db.execute(existing_votos_query)}
-        except SQLAlchemyError as e:
-            logger.error(f"Error querying existing votos: {e}")
-            existing_keys = set()
-        
-        # Filter for new votes only
-        new_df = valid_df[~valid_df['composite_key'].isin(existing_keys)]
-        
-        logger.info(f"Found {len(new_df)} new votos to add")
-        
-        # Transform and add new votes
-        votos_to_add = []
-        for _, row in new_df.iterrows():
-            try:
-                row_dict = {
-                    'votacao_id': row['idVotacao'],
-                    'deputado_id': int(row['deputadoId']),
-                    'data_registro_voto': row['dataRegistroVoto'],
-                    'tipo_voto': row['tipoVoto']
-                }
-                voto = transform_voto(row_dict, str(row['idVotacao']))
-                votos_to_add.append(voto)
-            except Exception as e:
-                logger.error(f"Error processing voto for votacao {row.get('idVotacao', 'unknown')}, deputado {row.get('deputadoId', 'unknown')}: {e}")
-        
-        # Commit new votes to database
+        # Normalize the key columns once, so duplicates are found regardless of type
+        df_votos_clean['idVotacao'] = df_votos_clean['idVotacao'].astype(str)
+        
+        # Compared after the deputadoId conversion so '123' and 123 are the same key
+        df_votos_clean = drop_duplicate_keys(df_votos_clean, "votos")
+        
+        # COPY can't parse a value outside tipo_voto_enum, and one would fail the whole batch
+        # (transform_votos already nulls them; this covers files processed before it did)
+        unknown_tipo = df_votos_clean['tipoVoto'].notna() & ~df_votos_clean['tipoVoto'].isin(TIPOS_VOTO)
+        if unknown_tipo.any():
+            logger.warning(
+                f"Dropping {int(unknown_tipo.sum())} votos with unknown tipoVoto: "
+                f"{sorted(df_votos_clean.loc[unknown_tipo, 'tipoVoto'].astype(str).unique())}"
+            )
+            df_votos_clean = df_votos_clean[~unknown_tipo]
+        
+        # Stage the batch in a temporary table and let PostgreSQL check the foreign keys
+        # and skip the votes it already has, all with index lookups on the server
+        votos_df = df_votos_clean[['idVotacao', 'deputadoId', 'dataRegistroVoto', 'tipoVoto']]
+        votos_columns = ["votacao_id", "deputado_id", "data_registro_voto", "tipo_voto"]
+        # The temp table doesn't inherit NOT NULL, so incomplete rows are skipped here
+        # instead of failing the INSERT for the whole batch
+        incomplete = "i.data_registro_voto IS NULL OR i.tipo_voto IS NULL"
+        votacao_exists = "EXISTS (SELECT 1 FROM votacoes v WHERE v.id = i.votacao_id)"
+        deputado_exists = "EXISTS (SELECT 1 FROM deputados d WHERE d.id = i.deputado_id)"
+        # The COPY, the checks and the INSERT share one connection and transaction
         try:
-            num_added = commit_to_db(db, votos_to_add, "votos")
-            return num_added
-        except IntegrityError as e:
-            db.rollback()
-            logger.error(f"Integrity error loading votos: {e}")
-            # Try inserting one by one to salvage what we can
-            num_added = 0
-            for voto in votos_to_add:
-                try:
-                    db.add(voto)
-                    db.commit()
-                    num_added += 1
-                except IntegrityError:
-                    db.rollback()
+            db.execute(text(
+                "CREATE TEMP TABLE _incoming_votos ON COMMIT DROP AS "
+                f"SELECT {', '.join(votos_columns)} FROM votos WITH NO DATA"
+            ))
+            copy_dataframe(db, votos_df, "_incoming_votos", votos_columns)
+            
+            num_incomplete, missing_votacao_ids, missing_deputado_ids = db.execute(text(
+                f"SELECT count(*) FILTER (WHERE {incomplete}), "
+                f"count(DISTINCT i.votacao_id) FILTER (WHERE NOT {votacao_exists}), "
+                f"count(DISTINCT i.deputado_id) FILTER (WHERE NOT {deputado_exists}) "
+                "FROM _incoming_votos i"
+            )).one()
+            
+            if num_incomplete:
+                logger.warning(f"Skipping {num_incomplete} votos without dataRegistroVoto or tipoVoto")
+            
+            if missing_votacao_ids:
+                logger.warning(f"Found {missing_votacao_ids} votacao IDs not in the database")
+            
+            if missing_deputado_ids:
+                logger.warning(f"Found {missing_deputado_ids} deputado IDs not in the database")
+            
+            # ON CONFLICT covers votes committed by a concurrent load after the anti-join's
+            # snapshot; it names no columns so it also works on databases where
+            # uq_votos_votacao_deputado couldn't be created (see create_tables)
+            num_added = db.execute(text(
+                f"INSERT INTO votos ({', '.join(votos_columns)}) "
+                f"SELECT {', '.join('i.' + column for column in votos_columns)} FROM _incoming_votos i "
+                f"WHERE NOT ({incomplete}) AND {votacao_exists} AND {deputado_exists} AND NOT EXISTS ("
+                "SELECT 1 FROM votos vv WHERE vv.votacao_id = i.votacao_id AND vv.deputado_id = i.deputado_id"
+                ") ON CONFLICT DO NOTHING"
+            )).rowcount
+            db.commit()
+            logger.info(f"Added {num_added} new votos to database.")
             return num_added
         except Exception as e:
             db.rollback()
-            logger.error(f"Error committing votos: {e}")
+            logger.error(f"Error inserting votos: {e}")
             return 0
     
     except Exception as e:
@@ -371,9 +493,8 @@ def load_votos(df_votos_clean: Optional[pd.DataFrame] = None) -> int:
         return 0
     finally:
         db.close()
-        engine.dispose()
 
-@task(name="Load Discursos", retries=3, retry_delay_seconds=30)
+@task(name="Load Discursos", cache_policy=NO_CACHE, retries=3, retry_delay_seconds=30)
 def load_discursos(df_discursos_clean: Optional[pd.DataFrame] = None) -> int:
     """
     Load speeches data into the database.
@@ -395,7 +516,7 @@ def load_discursos(df_discursos_clean: Optional[pd.DataFrame] = None) -> int:
 
     # Get database session
     try:
-        db, engine = get_db_session()
+        db = get_db_session()
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return 0
@@ -404,64 +525,69 @@ def load_discursos(df_discursos_clean: Optional[pd.DataFrame] = None) -> int:
     num_updated = 0
 
     try:
-        # First, determine which speeches are new (not in the database)
-        existing_ids_query = text("SELECT id FROM discursos")
+        # Normalize the IDs once; the lookup and the masks below reuse them
+        discurso_ids = pd.to_numeric(df_discursos_clean['id'], errors='coerce').astype('Int64')
+
+        # Find the speeches of this batch that are already in the database
         try:
-            existing_ids = {row[0] for row in db.execute(existing_ids_query)}
+            candidate_ids = discurso_ids.dropna().unique().tolist()
+            existing_ids = {row[0] for row in select_by_keys(db, select(Discurso.id), Discurso.id, candidate_ids)}
         except SQLAlchemyError as e:
             logger.error(f"Error querying existing discursos: {e}")
             existing_ids = set()
 
-        # Get the list of all IDs from the DataFrame
-        all_ids = set(df_discursos_clean['id'].unique())
+        # Determine new and existing speeches (rows without an ID are new)
+        update_mask = discurso_ids.isin(existing_ids).fillna(False).to_numpy(dtype=bool)
 
-        # Determine new and existing speeches
-        new_ids = all_ids - existing_ids
-        existing_ids_to_update = all_ids & existing_ids
+        logger.info(f"Found {int((~update_mask).sum())} new discursos and {int(update_mask.sum())} existing discursos to update")
 
-        logger.info(f"Found {len(new_ids)} new discursos and {len(existing_ids_to_update)} existing discursos to update")
-
-        # Process for insertion/update
+        # Process for insertion/update, as plain column mappings
         discursos_to_add = []
+        discursos_to_update = []
+        fields = resolve_fields('discursos', df_discursos_clean.columns)
         # Add new speeches
-        for _, row in df_discursos_clean[df_discursos_clean['id'].isin(new_ids)].iterrows():
+        for row_dict in df_discursos_clean[~update_mask].to_dict(orient="records"):
             try:
-                row_dict = row.to_dict()
-                # Transform to SQLAlchemy model
-                discurso = transform_discurso(row_dict)
-                discursos_to_add.append(discurso)
+                discursos_to_add.append(discurso_record(row_dict, row_dict.get('deputado_id'), fields))
             except Exception as e:
-                logger.error(f"Error processing discurso {row.get('id', 'unknown')}: {e}")
+                logger.error(f"Error processing discurso {row_dict.get('id', 'unknown')}: {e}")
 
         # Update existing speeches
-        for _, row in df_discursos_clean[df_discursos_clean['id'].isin(existing_ids_to_update)].iterrows():
+        for row_dict in df_discursos_clean[update_mask].to_dict(orient="records"):
+            try:
+                record = discurso_record(row_dict, row_dict.get('deputado_id'), fields)
+                record['id'] = int(row_dict['id'])
+                discursos_to_update.append(record)
+            except Exception as e:
+                logger.error(f"Error updating discurso {row_dict.get('id', 'unknown')}: {e}")
+        # Bulk load new speeches with COPY; if it fails they are inserted in batches below
+        copied = False
+        if discursos_to_add:
             try:
-                row_dict = row.to_dict()
-                # Get the existing speech from the database
-                existing_discurso = db.query(Discurso).filter(Discurso.id == row_dict['id']).first()
-
-                if existing_discurso:
-                    # Update fields
-                    existing_discurso.uri = row_dict.get('uri', existing_discurso.uri)
-                    existing_discurso.data = row_dict.get('data', existing_discurso.data)
-                    existing_discurso.id_deputado = row_dict.get('idDeputado', existing_discurso.id_deputado)
-                    existing_discurso.id_votacao = row_dict.get('idVotacao', existing_discurso.id_votacao)
-                    num_updated += 1
+                num_new = copy_records(db, Discurso.__table__, discursos_to_add)
+                copied = True
             except Exception as e:
-                logger.error(f"Error updating discurso {row.get('id', 'unknown')}: {e}")
-        # Commit new speeches to database
+                db.rollback()
+                logger.warning(f"COPY of discursos failed, falling back to batched INSERT: {e}")
+
+        # Write new and updated speeches in batches
         try:
-            num_new = commit_to_db(db, discursos_to_add, "discursos (new)")
-            db.commit()  # Commit updates
+            if not copied:
+                num_new = bulk_insert(db, Discurso, discursos_to_add)
+            num_updated = bulk_update(db, Discurso, discursos_to_update)
+            db.commit()
+            logger.info(f"Inserted {num_new} and updated {num_updated} discursos.")
 
         except IntegrityError as e:
             db.rollback()
             logger.error(f"Integrity error loading discursos: {e}")
-            # Try inserting one by one to salvage what we can
+            # Apply the updates, then insert one by one to salvage what we can
+            num_updated = bulk_update(db, Discurso, discursos_to_update)
+            db.commit()
             num_new = 0
-            for discurso in discursos_to_add:
+            for record in discursos_to_add:
                 try:
-                    db.add(discurso)
+                    db.execute(insert(Discurso.__table__), [record])
                     db.commit()
                     num_new += 1
                 except IntegrityError:
@@ -478,7 +604,6 @@ def load_discursos(df_discursos_clean: Optional[pd.DataFrame] = None) -> int:
         return 0
     finally:
         db.close()
-        engine.dispose()
 
 
 
@@ -1,264 +1,314 @@
+import json
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Any, Optional
 import logging
 from prefect import task
+from prefect.cache_policies import NO_CACHE
 
 # Import database models
-from app.database.models import Deputado, Despesa, Discurso, Votacao, Voto
+from app.database.models import TIPOS_VOTO
 from app.ingestion.utils import save_dataframe, load_dataframe
 
 logger = logging.getLogger(__name__)
 
-# ---- Funções para transformar registros individuais em modelos SQLAlchemy ----
+# ---- Mapeamento de campos da API para colunas do banco ----
+# Each entry is (column, keys looked up in order, default when none is present);
+# API records use camelCase keys and processed DataFrames use the column names.
+# A callable default is called, so each record gets its own empty dict.
 
-def transform_deputado(data: Union[Dict, pd.DataFrame]) -> Deputado:
+_DEPUTADO_FIELDS = (
+    ('uri', ('uri',), ''),
+    ('nome_civil', ('nomeCivil', 'nome_civil', 'nome'), ''),
+    ('cpf', ('cpf',), None),
+    ('sexo', ('sexo',), None),
+    ('escolaridade', ('escolaridade',), None),
+    ('url_website', ('urlWebsite', 'url_website'), None),
+    ('data_nascimento', ('dataNascimento', 'data_nascimento'), None),
+    ('data_falecimento', ('dataFalecimento', 'data_falecimento'), None),
+    ('uf_nascimento', ('ufNascimento', 'uf_nascimento'), None),
+    ('municipio_nascimento', ('municipioNascimento', 'municipio_nascimento'), None),
+)
+
+# Deputado columns read from the nested ultimoStatus object; when the status value
+# is empty, the keys are looked up in the top-level record instead
+_DEPUTADO_STATUS_FIELDS = (
+    ('ultimo_status_id', 'id', ('ultimo_status_id',), None),
+    ('ultimo_status_nome', 'nome', ('nome', 'ultimo_status_nome'), None),
+    ('ultimo_status_sigla_partido', 'siglaPartido', ('siglaPartido', 'sigla_partido', 'ultimo_status_sigla_partido'), None),
+    ('ultimo_status_uri_partido', 'uriPartido', ('uriPartido', 'ultimo_status_uri_partido'), None),
+    ('ultimo_status_sigla_uf', 'siglaUf', ('siglaUf', 'sigla_uf', 'ultimo_status_sigla_uf'), None),
+    ('ultimo_status_id_legislatura', 'idLegislatura', ('idLegislatura', 'ultimo_status_id_legislatura'), None),
+    ('ultimo_status_url_foto', 'urlFoto', ('urlFoto', 'url_foto', 'ultimo_status_url_foto'), None),
+    ('ultimo_status_email', 'email', ('email', 'ultimo_status_email'), None),
+    ('ultimo_status_data', 'data', ('ultimo_status_data',), None),
+    ('ultimo_status_nome_eleitoral', 'nomeEleitoral', ('ultimo_status_nome_eleitoral',), None),
+    ('ultimo_status_situacao', 'situacao', ('ultimo_status_situacao',), None),
+    ('ultimo_status_condicao_eleitoral', 'condicaoEleitoral', ('ultimo_status_condicao_eleitoral',), None),
+    ('ultimo_status_descricao', 'descricaoStatus', ('ultimo_status_descricao',), None),
+    # Gabinete is a JSON field, not individual fields
+    ('ultimo_status_gabinete', 'gabinete', ('ultimo_status_gabinete',), dict),
+)
+
+_DESPESA_FIELDS = (
+    ('ano', ('ano',), None),
+    ('mes', ('mes',), None),
+    ('tipo_despesa', ('tipoDespesa', 'tipo_despesa'), ''),
+    ('cod_documento', ('codDocumento', 'cod_documento'), 0),
+    ('tipo_documento', ('tipoDocumento', 'tipo_documento'), ''),
+    ('cod_tipo_documento', ('codTipoDocumento', 'cod_tipo_documento'), 0),
+    ('data_documento', ('dataDocumento', 'data_documento'), None),
+    ('num_documento', ('numDocumento', 'num_documento'), ''),
+    ('valor_documento', ('valorDocumento', 'valor_documento'), 0.0),
+    ('url_documento', ('urlDocumento', 'url_documento'), ''),
+    ('nome_fornecedor', ('nomeFornecedor', 'nome_fornecedor'), ''),
+    ('cnpj_cpf_fornecedor', ('cnpjCpfFornecedor', 'cnpj_cpf_fornecedor'), ''),
+    ('valor_liquido', ('valorLiquido', 'valor_liquido'), 0.0),
+    ('valor_glosa', ('valorGlosa', 'valor_glosa'), 0.0),
+    ('num_ressarcimento', ('numRessarcimento', 'num_ressarcimento'), None),
+    ('cod_lote', ('codLote', 'cod_lote'), None),
+    ('parcela', ('parcela',), None),
+)
+
+_DISCURSO_FIELDS = (
+    ('data_hora_inicio', ('dataHoraInicio', 'data_hora_inicio'), None),
+    ('data_hora_fim', ('dataHoraFim', 'data_hora_fim'), None),
+    ('fase_evento', ('faseEvento', 'fase_evento'), None),
+    ('tipo_discurso', ('tipoDiscurso', 'tipo_discurso'), ''),
+    ('url_texto', ('urlTexto', 'url_texto'), None),
+    ('url_audio', ('urlAudio', 'url_audio'), None),
+    ('url_video', ('urlVideo', 'url_video'), None),
+    ('keywords', ('keywords',), None),
+    ('sumario', ('sumario',), None),
+    ('transcricao', ('transcricao',), None),
+)
+
+_VOTACAO_FIELDS = (
+    ('uri', ('uri',), ''),
+    ('data', ('data',), None),
+    ('data_hora_registro', ('dataHoraRegistro', 'data_hora_registro'), None),
+    ('sigla_orgao', ('siglaOrgao', 'sigla_orgao'), ''),
+    ('uri_orgao', ('uriOrgao', 'uri_orgao'), ''),
+    ('proposicao_objeto', ('proposicaoObjeto', 'proposicao_objeto'), None),
+    ('tipo_votacao', ('tipoVotacao', 'tipo_votacao'), dict),
+    ('ultima_apresentacao_proposicao', ('ultimaApresentacaoProposicao', 'ultima_apresentacao_proposicao'), None),
+    ('aprovacao', ('aprovacao',), False),
+)
+
+def _map_fields(data: Dict, fields: tuple, record: Optional[Dict] = None) -> Dict:
     """
-    Transform deputy data from API to database model format.
+    Build column values from a record using a field table (see _DEPUTADO_FIELDS).
     
     Args:
-        data: Dictionary with deputy data from API
+        data: Record from the API or a processed DataFrame row
+        fields: Field table with (column, keys, default) entries
+        record: Dict to fill in (a new one by default)
         
     Returns:
-        Deputado: Database model instance
+        Dict of column values
     """
-    try:
-        # Handle ultimo_status data
-        ultimo_status = data.get('ultimoStatus', data.get('ultimo_status', {}))
-        if isinstance(ultimo_status, str) and ultimo_status.startswith('{'):
-            # Handle case where ultimo_status might be a JSON string
-            import json
-            try:
-                ultimo_status = json.loads(ultimo_status)
-            except:
-                ultimo_status = {}
-        
-        # Handle gabinete data properly as JSON field
-        gabinete = ultimo_status.get('gabinete', {})
-        
-        # Create the deputado object with only valid fields from the schema
-        deputado = Deputado(
-            id=data['id'],
-            uri=data.get('uri', ''),
-            nome_civil=data.get('nomeCivil', data.get('nome_civil', data.get('nome', ''))),
-            cpf=data.get('cpf'),
-            sexo=data.get('sexo'),
-            escolaridade=data.get('escolaridade'),
-            url_website=data.get('urlWebsite', data.get('url_website')),
-            data_nascimento=data.get('dataNascimento', data.get('data_nascimento')),
-            data_falecimento=data.get('dataFalecimento', data.get('data_falecimento')),
-            uf_nascimento=data.get('ufNascimento', data.get('uf_nascimento')),
-            municipio_nascimento=data.get('municipioNascimento', data.get('municipio_nascimento')),
-            
-            # UltimoStatus fields
-            ultimo_status_id=ultimo_status.get('id'),
-            ultimo_status_nome=ultimo_status.get('nome', data.get('nome')),
-            ultimo_status_sigla_partido=ultimo_status.get('siglaPartido', data.get('siglaPartido')),
-            ultimo_status_uri_partido=ultimo_status.get('uriPartido', data.get('uriPartido')),
-            ultimo_status_sigla_uf=ultimo_status.get('siglaUf', data.get('siglaUf')),
-            ultimo_status_id_legislatura=ultimo_status.get('idLegislatura', data.get('idLegislatura')),
-            ultimo_status_url_foto=ultimo_status.get('urlFoto', data.get('urlFoto')),
-            ultimo_status_email=ultimo_status.get('email', data.get('email')),
-            ultimo_status_data=ultimo_status.get('data'),
-            ultimo_status_nome_eleitoral=ultimo_status.get('nomeEleitoral'),
-            ultimo_status_situacao=ultimo_status.get('situacao'),
-            ultimo_status_condicao_eleitoral=ultimo_status.get('condicaoEleitoral'),
-            ultimo_status_descricao=ultimo_status.get('descricaoStatus'),
-            
-            # Gabinete is a JSON field, not individual fields
-            ultimo_status_gabinete=gabinete
-        )
-        
-        # Alternative field sources if primary fields are not available
-        if not deputado.ultimo_status_nome:
-            deputado.ultimo_status_nome = data.get('nome')
-        if not deputado.ultimo_status_sigla_partido:
-            deputado.ultimo_status_sigla_partido = data.get('siglaPartido', data.get('sigla_partido'))
-        if not deputado.ultimo_status_sigla_uf:
-            deputado.ultimo_status_sigla_uf = data.get('siglaUf', data.get('sigla_uf'))
-        if not deputado.ultimo_status_email:
-            deputado.ultimo_status_email = data.get('email')
-        if not deputado.ultimo_status_url_foto:
-            deputado.ultimo_status_url_foto = data.get('urlFoto', data.get('url_foto'))
-        
-        return deputado
-        
-    except Exception as e:
-        logger.error(f"Error transforming deputado data: {e}")
-        logger.debug(f"Problematic data: {data}")
-        raise
+    if record is None:
+        record = {}
+    for column, keys, default in fields:
+        for key in keys:
+            if key in data:
+                record[column] = data[key]
+                break
+        else:
+            record[column] = default() if callable(default) else default
+    return record
 
-def transform_despesa(data: Union[Dict, pd.DataFrame], deputado_id: int) -> Despesa:
+def _resolve_fields(fields: tuple, keys) -> tuple:
     """
-    Transform expense data from API to database model format.
+    Resolve a field table against the keys shared by every record of a batch.
+    
+    Each entry keeps only the first of its keys that is present (or none), so
+    _map_fields does a single lookup per column instead of probing the camelCase
+    and snake_case spellings on every row.
     
     Args:
-        data: Dictionary with expense data from API
-        deputado_id: ID of the deputy associated with the expense
+        fields: Field table with (column, keys, default) entries
+        keys: Keys of the batch's records (e.g. DataFrame columns)
         
     Returns:
-        Despesa: Database model instance
+        Field table of the same shape, with at most one key per column
     """
-    try:
-        return Despesa(
-            deputado_id=deputado_id,
-            ano=data.get('ano'),
-            mes=data.get('mes'),
-            tipo_despesa=data.get('tipoDespesa', data.get('tipo_despesa', '')),
-            cod_documento=data.get('codDocumento', data.get('cod_documento', 0)),
-            tipo_documento=data.get('tipoDocumento', data.get('tipo_documento', '')),
-            cod_tipo_documento=data.get('codTipoDocumento', data.get('cod_tipo_documento', 0)),
-            data_documento=data.get('dataDocumento', data.get('data_documento')),
-            num_documento=data.get('numDocumento', data.get('num_documento', '')),
-            valor_documento=data.get('valorDocumento', data.get('valor_documento', 0.0)),
-            url_documento=data.get('urlDocumento', data.get('url_documento', '')),
-            nome_fornecedor=data.get('nomeFornecedor', data.get('nome_fornecedor', '')),
-            cnpj_cpf_fornecedor=data.get('cnpjCpfFornecedor', data.get('cnpj_cpf_fornecedor', '')),
-            valor_liquido=data.get('valorLiquido', data.get('valor_liquido', 0.0)),
-            valor_glosa=data.get('valorGlosa', data.get('valor_glosa', 0.0)),
-            num_ressarcimento=data.get('numRessarcimento', data.get('num_ressarcimento')),
-            cod_lote=data.get('codLote', data.get('cod_lote')),
-            parcela=data.get('parcela')
-        )
-    except Exception as e:
-        logger.error(f"Error transforming despesa data: {e}")
-        logger.debug(f"Problematic data: {data}")
-        raise
+    keys = set(keys)
+    return tuple(
+        (column, tuple(key for key in candidates if key in keys)[:1], default)
+        for column, candidates, default in fields
+    )
 
-def transform_discurso(data: Union[Dict, pd.DataFrame], deputado_id: int) -> Discurso:
+# ---- Funções para converter registros em colunas do banco ----
+# The loaders insert these dicts directly, without building ORM objects
+
+def deputado_record(data: Dict, fields: tuple = _DEPUTADO_FIELDS) -> Dict:
     """
-    Transform speech data from API to database model format.
+    Map deputy data from the API or a processed DataFrame row to deputados columns.
     
     Args:
-        data: Dictionary with speech data from API
-        deputado_id: ID of the deputy associated with the speech
+        data: Dictionary with deputy data
+        fields: Field table for the top-level fields (see resolve_fields)
         
     Returns:
-        Discurso: Database model instance
+        Dict of column values
     """
-    try:
-        return Discurso(
-            deputado_id=deputado_id,
-            data_hora_inicio=data.get('dataHoraInicio', data.get('data_hora_inicio')),
-            data_hora_fim=data.get('dataHoraFim', data.get('data_hora_fim')),
-            fase_evento=data.get('faseEvento', data.get('fase_evento')),
-            tipo_discurso=data.get('tipoDiscurso', data.get('tipo_discurso', '')),
-            url_texto=data.get('urlTexto', data.get('url_texto')),
-            url_audio=data.get('urlAudio', data.get('url_audio')),
-            url_video=data.get('urlVideo', data.get('url_video')),
-            keywords=data.get('keywords'),
-            sumario=data.get('sumario'),
-            transcricao=data.get('transcricao')
-        )
-    except Exception as e:
-        logger.error(f"Error transforming discurso data: {e}")
-        logger.debug(f"Problematic data: {data}")
-        raise
+    ultimo_status = _parse_json_dict(data.get('ultimoStatus', data.get('ultimo_status')))
+    
+    record = _map_fields(data, fields, {'id': data['id']})
+    for column, status_key, keys, default in _DEPUTADO_STATUS_FIELDS:
+        value = ultimo_status.get(status_key)
+        if not value:
+            # Alternative field sources if the status value is not available
+            for key in keys:
+                if key in data:
+                    value = data[key]
+                    break
+            else:
+                if value is None:
+                    value = default() if callable(default) else default
+        record[column] = value
+    return record
 
-def transform_votacao(data: Union[Dict, pd.DataFrame]) -> Votacao:
+def discurso_record(data: Dict, deputado_id: int, fields: tuple = _DISCURSO_FIELDS) -> Dict:
     """
-    Transform voting session data from API to database model format.
+    Map speech data from the API or a processed DataFrame row to discursos columns.
     
     Args:
-        data: Dictionary with voting session data from API
+        data: Dictionary with speech data
+        deputado_id: ID of the deputy associated with the speech
+        fields: Field table to use (see resolve_fields)
         
     Returns:
-        Votacao: Database model instance
+        Dict of column values (without the id, which the database assigns)
     """
-    try:
-        # Garantir que temos um ID válido
-        if 'id' not in data:
-            logger.error("Missing ID in votacao data")
-            raise ValueError("Votacao data must have an ID")
-            
-        return Votacao(
-            id=data['id'],
-            uri=data.get('uri', ''),
-            data=data.get('data'),
-            data_hora_registro=data.get('dataHoraRegistro', data.get('data_hora_registro')),
-            sigla_orgao=data.get('siglaOrgao', data.get('sigla_orgao', '')),
-            uri_orgao=data.get('uriOrgao', data.get('uri_orgao', '')),
-            proposicao_objeto=data.get('proposicaoObjeto', data.get('proposicao_objeto')),
-            tipo_votacao=data.get('tipoVotacao', data.get('tipo_votacao', {})),
-            ultima_apresentacao_proposicao=data.get('ultimaApresentacaoProposicao', 
-                                               data.get('ultima_apresentacao_proposicao')),
-            aprovacao=data.get('aprovacao', False)
-        )
-    except Exception as e:
-        logger.error(f"Error transforming votacao data: {e}")
-        logger.debug(f"Problematic data: {data}")
-        raise
+    return _map_fields(data, fields, {'deputado_id': deputado_id})
 
-def transform_voto(data: Union[Dict, pd.DataFrame], votacao_id: str) -> Voto:
+def despesa_record(data: Dict, deputado_id: int, fields: tuple = _DESPESA_FIELDS) -> Dict:
     """
-    Transform vote data from API to database model format.
+    Map expense data from the API or a processed DataFrame row to despesas columns.
     
     Args:
-        data: Dictionary with vote data from API
-        votacao_id: ID of the voting session
+        data: Dictionary with expense data
+        deputado_id: ID of the deputy associated with the expense
+        fields: Field table to use (see resolve_fields)
         
     Returns:
-        Voto: Database model instance
+        Dict of column values
     """
-    try:
-        # Obter o ID do deputado, que pode estar em diferentes locais
-        deputado_id = None
+    return _map_fields(data, fields, {'deputado_id': deputado_id})
+
+def votacao_record(data: Dict, fields: tuple = _VOTACAO_FIELDS) -> Dict:
+    """
+    Map voting session data from the API or a processed DataFrame row to votacoes columns.
+    
+    Args:
+        data: Dictionary with voting session data
+        fields: Field table to use (see resolve_fields)
         
-        # Verificar se existe como campo 'deputado_id'
-        if 'deputado_id' in data or 'deputadoId' in data:
-            deputado_id = data.get('deputado_id', data.get('deputadoId'))
+    Returns:
+        Dict of column values
         
-        # Verificar se existe como objeto aninhado 'deputado'
-        elif 'deputado' in data and isinstance(data['deputado'], dict):
-            deputado_id = data['deputado'].get('id')
+    Raises:
+        ValueError: If the data has no ID
+    """
+    # Garantir que temos um ID válido
+    if 'id' not in data:
+        logger.error("Missing ID in votacao data")
+        raise ValueError("Votacao data must have an ID")
+    
+    return _map_fields(data, fields, {'id': data['id']})
+
+# Field table of each entity's *_record function
+_ENTITY_FIELDS = {
+    'deputados': _DEPUTADO_FIELDS,
+    'despesas': _DESPESA_FIELDS,
+    'discursos': _DISCURSO_FIELDS,
+    'votacoes': _VOTACAO_FIELDS,
+}
+
+def resolve_fields(entity: str, columns) -> tuple:
+    """
+    Resolve the field table of an entity for a batch.
+    
+    All rows of a DataFrame have the same keys, so whether the batch uses API
+    (camelCase) or processed (snake_case) names is decided once here; pass the
+    result as `fields` to every *_record call of the batch.
+    
+    Args:
+        entity: 'deputados', 'despesas', 'discursos' or 'votacoes'
+        columns: Keys of the batch's records (e.g. DataFrame columns)
         
-        # Verificar se existe como objeto aninhado 'deputado_'
-        elif 'deputado_' in data and isinstance(data['deputado_'], dict):
-            deputado_id = data['deputado_'].get('id')
+    Returns:
+        Resolved field table
+    """
+    return _resolve_fields(_ENTITY_FIELDS[entity], columns)
+
+def _parse_json_dict(value: Any) -> Dict:
+    """
+    Normalize a nested API object that may come as a dict or a JSON string.
+    
+    Args:
+        value: Dict, JSON string or missing value
         
-        if not deputado_id:
-            logger.warning(f"No deputado_id found in vote data for votacao {votacao_id}")
+    Returns:
+        Parsed dict, or an empty dict when the value can't be parsed
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value.startswith('{'):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return {}
+    return {}
+
+def _coalesce(df: pd.DataFrame, *names: str) -> pd.Series:
+    """
+    Return the first non-null value across the given columns, row by row.
+    
+    Args:
+        df: Source DataFrame
+        *names: Candidate column names, in order of preference
         
-        return Voto(
-            votacao_id=votacao_id,
-            deputado_id=deputado_id,
-            data_registro_voto=data.get('dataRegistroVoto', data.get('data_registro_voto')),
-            tipo_voto=data.get('tipoVoto', data.get('tipo_voto', ''))
-        )
-    except Exception as e:
-        logger.error(f"Error transforming voto data: {e}")
-        logger.debug(f"Problematic data: {data}")
-        raise
+    Returns:
+        Series aligned with df (all None when no column exists)
+    """
+    result = pd.Series(None, index=df.index, dtype=object)
+    for name in names:
+        if name in df.columns:
+            result = result.combine_first(df[name].astype(object))
+    return result
 
-def transform_dataframe_to_models(df: pd.DataFrame, transform_func, **kwargs) -> List:
+def _to_date(series: pd.Series) -> pd.Series:
     """
-    Transform a pandas DataFrame to a list of database model instances.
+    Vectorized conversion of date strings to datetime.date (None when invalid).
     
     Args:
-        df: DataFrame with data from API
-        transform_func: Function to transform each row
-        **kwargs: Additional arguments to pass to transform_func
+        series: Series with date strings
         
     Returns:
-        List of database model instances
+        Series of datetime.date objects
+    """
+    dates = pd.to_datetime(series, errors='coerce')
+    return dates.dt.date.astype(object).where(dates.notna(), None)
+
+def _extract_nested_id(series: pd.Series) -> pd.Series:
     """
-    if df is None or df.empty:
-        return []
+    Extract the 'id' key from a column of nested dicts.
     
-    result = []
-    for idx, row in df.iterrows():
-        try:
-            row_dict = row.to_dict()
-            model = transform_func(row_dict, **kwargs)
-            result.append(model)
-        except Exception as e:
-            logger.error(f"Error transforming row {idx}: {e}")
-            
-    return result
+    Args:
+        series: Series whose values are dicts (e.g. the 'deputado' object of a vote)
+        
+    Returns:
+        Series with the extracted IDs
+    """
+    if series.dtype != object:
+        return pd.Series(None, index=series.index, dtype=object)
+    return series.str.get('id')
 
 # ---- Tarefas Prefect para transformação de DataFrames ----
 
-@task(name="Transform Deputados")
+@task(name="Transform Deputados", cache_policy=NO_CACHE)
 def transform_deputados(df_deputados: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Transform deputies data from API format to a format suitable for database loading.
@@ -278,70 +328,58 @@ def transform_deputados(df_deputados: Optional[pd.DataFrame] = None) -> pd.DataF
     
     logger.info(f"Transforming {len(df_deputados)} deputados")
     
-    # Create result DataFrame with the structure matching the database model
-    result = []
+    # Parse the nested ultimo_status once and expand it into columns
+    if 'ultimo_status' in df_deputados.columns:
+        ultimo_status = df_deputados['ultimo_status'].map(_parse_json_dict)
+    else:
+        ultimo_status = pd.Series([{}] * len(df_deputados), index=df_deputados.index)
+    df_status = pd.DataFrame(ultimo_status.tolist(), index=df_deputados.index)
     
-    for _, row in df_deputados.iterrows():
-        try:
-            # Extract ultimo_status data from the nested JSON or dict
-            ultimo_status = row.get('ultimo_status', {})
-            if isinstance(ultimo_status, str):
-                # Handle case where ultimo_status might be a JSON string
-                try:
-                    import json
-                    ultimo_status = json.loads(ultimo_status)
-                except:
-                    ultimo_status = {}
-            
-            # Direct conversion from API fields to database fields
-            deputado_dict = {
-                # Basic fields
-                'id': row['id'],
-                'uri': row.get('uri', ''),
-                'nome_civil': row.get('nomeCivil', row.get('nome', '')),
-                'cpf': row.get('cpf'),
-                'sexo': row.get('sexo'),
-                'escolaridade': row.get('escolaridade'),
-                'url_website': row.get('urlWebsite', row.get('url_website')),
-                'data_nascimento': row.get('dataNascimento', row.get('data_nascimento')),
-                'data_falecimento': row.get('dataFalecimento', row.get('data_falecimento')),
-                'uf_nascimento': row.get('ufNascimento', row.get('uf_nascimento')),
-                'municipio_nascimento': row.get('municipioNascimento', row.get('municipio_nascimento')),
-                
-                # UltimoStatus fields
-                'ultimo_status_id': ultimo_status.get('id'),
-                'ultimo_status_nome': ultimo_status.get('nome', row.get('nome')),
-                'ultimo_status_sigla_partido': ultimo_status.get('siglaPartido', row.get('siglaPartido')),
-                'ultimo_status_uri_partido': ultimo_status.get('uriPartido', row.get('uriPartido')),
-                'ultimo_status_sigla_uf': ultimo_status.get('siglaUf', row.get('siglaUf')),
-                'ultimo_status_id_legislatura': ultimo_status.get('idLegislatura', row.get('idLegislatura')),
-                'ultimo_status_url_foto': ultimo_status.get('urlFoto', row.get('urlFoto')),
-                'ultimo_status_email': ultimo_status.get('email', row.get('email')),
-                'ultimo_status_data': ultimo_status.get('data'),
-                'ultimo_status_nome_eleitoral': ultimo_status.get('nomeEleitoral'),
-                'ultimo_status_situacao': ultimo_status.get('situacao'),
-                'ultimo_status_condicao_eleitoral': ultimo_status.get('condicaoEleitoral'),
-                'ultimo_status_descricao': ultimo_status.get('descricaoStatus')
-            }
-            
-            # Handle gabinete data if present
-            gabinete = ultimo_status.get('gabinete', {})
-            if gabinete and isinstance(gabinete, dict):
-                deputado_dict['ultimo_status_gabinete'] = gabinete
-            
-            result.append(deputado_dict)
-        except Exception as e:
-            logger.error(f"Error transforming deputado record: {e}")
+    # Direct column-wise conversion from API fields to database fields
+    df_clean = pd.DataFrame({
+        # Basic fields
+        'id': df_deputados['id'],
+        'uri': _coalesce(df_deputados, 'uri').fillna(''),
+        'nome_civil': _coalesce(df_deputados, 'nomeCivil', 'nome').fillna(''),
+        'cpf': _coalesce(df_deputados, 'cpf').str.replace(r'\D', '', regex=True),
+        'sexo': _coalesce(df_deputados, 'sexo'),
+        'escolaridade': _coalesce(df_deputados, 'escolaridade'),
+        'url_website': _coalesce(df_deputados, 'urlWebsite', 'url_website'),
+        'data_nascimento': _to_date(_coalesce(df_deputados, 'dataNascimento', 'data_nascimento')),
+        'data_falecimento': _to_date(_coalesce(df_deputados, 'dataFalecimento', 'data_falecimento')),
+        'uf_nascimento': _coalesce(df_deputados, 'ufNascimento', 'uf_nascimento'),
+        'municipio_nascimento': _coalesce(df_deputados, 'municipioNascimento', 'municipio_nascimento'),
+        
+        # UltimoStatus fields, falling back to the flattened list columns
+        'ultimo_status_id': _coalesce(df_status, 'id'),
+        'ultimo_status_nome': _coalesce(df_status, 'nome').combine_first(_coalesce(df_deputados, 'nome')),
+        'ultimo_status_sigla_partido': _coalesce(df_status, 'siglaPartido').combine_first(_coalesce(df_deputados, 'siglaPartido')),
+        'ultimo_status_uri_partido': _coalesce(df_status, 'uriPartido').combine_first(_coalesce(df_deputados, 'uriPartido')),
+        'ultimo_status_sigla_uf': _coalesce(df_status, 'siglaUf').combine_first(_coalesce(df_deputados, 'siglaUf')),
+        'ultimo_status_id_legislatura': _coalesce(df_status, 'idLegislatura').combine_first(_coalesce(df_deputados, 'idLegislatura')),
+        'ultimo_status_url_foto': _coalesce(df_status, 'urlFoto').combine_first(_coalesce(df_deputados, 'urlFoto')),
+        'ultimo_status_email': _coalesce(df_status, 'email').combine_first(_coalesce(df_deputados, 'email')),
+        'ultimo_status_data': _to_date(_coalesce(df_status, 'data')),
+        'ultimo_status_nome_eleitoral': _coalesce(df_status, 'nomeEleitoral'),
+        'ultimo_status_situacao': _coalesce(df_status, 'situacao'),
+        'ultimo_status_condicao_eleitoral': _coalesce(df_status, 'condicaoEleitoral'),
+        'ultimo_status_descricao': _coalesce(df_status, 'descricaoStatus'),
+        
+        # Gabinete is kept as a JSON field
+        'ultimo_status_gabinete': _coalesce(df_status, 'gabinete').where(
+            _coalesce(df_status, 'gabinete').map(lambda g: isinstance(g, dict) and bool(g)), None
+        )
+    }, index=df_deputados.index)
     
-    # Convert to DataFrame
-    df_clean = pd.DataFrame(result)
+    # Use None for missing values so they are stored as NULL
+    df_clean = df_clean.astype(object).where(df_clean.notna(), None).reset_index(drop=True)
     
     # Save processed data
     save_dataframe(df_clean, "deputados", processed=True)
     
     return df_clean
 
-@task(name="Transform Votacoes")
+@task(name="Transform Votacoes", cache_policy=NO_CACHE)
 def transform_votacoes(df_votacoes: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Transform voting sessions data.
@@ -418,7 +456,7 @@ def transform_votacoes(df_votacoes: Optional[pd.DataFrame] = None) -> pd.DataFra
             return pd.DataFrame({'id': df_votacoes['id']})
         return None
 
-@task(name="Transform Votos")
+@task(name="Transform Votos", cache_policy=NO_CACHE)
 def transform_votos(df_votos: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Transform votes data.
@@ -477,22 +515,22 @@ def transform_votos(df_votos: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         
         # Caso 2: O ID do deputado está em uma coluna aninhada como 'deputado_'
         elif 'deputado_' in df_votos.columns:
-            # Tentar extrair o ID do objeto aninhado
-            def extract_deputado_id(dep_obj):
-                if isinstance(dep_obj, dict):
-                    return dep_obj.get('id')
-                return None
-            
-            df_clean['deputadoId'] = df_votos['deputado_'].apply(extract_deputado_id)
+            df_clean['deputadoId'] = _extract_nested_id(df_votos['deputado_'])
         
         # Caso 3: O ID do deputado está em uma coluna aninhada como 'deputado'
         elif 'deputado' in df_votos.columns:
-            def extract_deputado_id(dep_obj):
-                if isinstance(dep_obj, dict):
-                    return dep_obj.get('id')
-                return None
-            
-            df_clean['deputadoId'] = df_votos['deputado'].apply(extract_deputado_id)
+            df_clean['deputadoId'] = _extract_nested_id(df_votos['deputado'])
+        
+        # tipo_voto is an enum: values outside TIPOS_VOTO become NULL, and load_votos
+        # skips those votes instead of failing the whole batch on them
+        tipo_voto = df_clean['tipoVoto'].astype(object)
+        unknown_tipo = tipo_voto.notna() & ~tipo_voto.isin(TIPOS_VOTO)
+        if unknown_tipo.any():
+            logger.warning(
+                f"Found {int(unknown_tipo.sum())} votos with unknown tipoVoto: "
+                f"{sorted(tipo_voto[unknown_tipo].astype(str).unique())}"
+            )
+            df_clean['tipoVoto'] = tipo_voto.where(~unknown_tipo, None)
             
         # Convert data types
         df_clean = df_clean.convert_dtypes()
@@ -516,7 +554,7 @@ def transform_votos(df_votos: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         except:
             return None
         
-@task(name="Transform Discursos")
+@task(name="Transform Discursos", cache_policy=NO_CACHE)
 def transform_discursos(df_discursos: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Transform speeches data.
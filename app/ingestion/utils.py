@@ -1,24 +1,107 @@
+import asyncio
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Iterator, List, Optional, TypeVar, Union
 import pandas as pd
-from sqlalchemy.orm import Session
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 
-from app.config import LOG_FILE, RAW_DATA_DIR, PROCESSED_DATA_DIR
+from app.config import LOG_FILE, RAW_DATA_DIR, PROCESSED_DATA_DIR, ensure_dirs
+
+# Make sure data and log directories exist before any ETL module uses them
+ensure_dirs()
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+def configure_logging() -> QueueListener:
+    """
+    Send all logging through a queue to the file and console handlers.
+    
+    Records (the ETL's own and those Prefect's run loggers propagate to the root
+    logger) are only enqueued by the logging thread; a background listener does
+    the file and terminal writes, so they stay off the critical path of the run.
+    Replaces the console handler Prefect installs on the root logger on import.
+    
+    Returns:
+        The started listener; it is stopped (and the queue flushed) at exit
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The listener's handlers add the timestamp, name and level
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    return listener
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+log_listener = configure_logging()
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# zstd compresses the raw API dumps much better than the default snappy at similar
+# decode speed; repeated strings (party, UF, vote type) are dictionary-encoded
+PARQUET_COMPRESSION = "zstd"
+
+# Progress bars redraw at most once per second and are turned off when stderr is
+# not a terminal (cron, containers), where every redraw is just log noise
+PROGRESS_OPTIONS = {"mininterval": 1.0, "smoothing": 0, "disable": None}
+
+# Sentinel marking the end of a prefetched iterable
+_PREFETCH_END = object()
+
+class RateLimiter:
+    """
+    Space out calls so that at most `rate` start per second.
+    
+    Safe to share between threads and coroutines: each caller reserves the
+    next free slot under a lock and then sleeps outside of it. A rate of 0
+    disables the limit.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def _reserve(self) -> float:
+        """Reserve the next slot and return how long to wait for it."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+    
+    def wait(self) -> None:
+        """Block the calling thread until its slot is due."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self) -> None:
+        """Suspend the calling coroutine until its slot is due."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 def save_dataframe(df: pd.DataFrame, name: str, processed: bool = False) -> str:
     """
     Save a DataFrame to parquet file.
@@ -39,17 +122,19 @@ def save_dataframe(df: pd.DataFrame, name: str, processed: bool = False) -> str:
     os.makedirs(directory, exist_ok=True)
     
     file_path = os.path.join(directory, f"{name}.parquet")
-    df.to_parquet(file_path, index=False)
+    df.to_parquet(file_path, index=False, engine="pyarrow", compression=PARQUET_COMPRESSION)
     logger.info(f"Saved {name} to {file_path}")
     return file_path
 
-def load_dataframe(name: str, processed: bool = False) -> pd.DataFrame:
+def load_dataframe(name: str, processed: bool = False,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Load a DataFrame from parquet file.
     
     Args:
         name: Name of the file (without extension)
         processed: Whether to load from processed directory
+        columns: Columns to read, all when None; the others are never decoded
         
     Returns:
         Loaded DataFrame or None if file doesn't exist
@@ -61,10 +146,216 @@ def load_dataframe(name: str, processed: bool = False) -> pd.DataFrame:
         logger.warning(f"File {file_path} does not exist.")
         return None
     
-    df = pd.read_parquet(file_path)
+    df = pd.read_parquet(file_path, engine="pyarrow", columns=columns)
     logger.info(f"Loaded {name} from {file_path}")
     return df
 
+def _align_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a chunk to the writer schema, adding the columns it lacks as nulls."""
+    extra = set(table.column_names) - set(schema.names)
+    if extra:
+        # Never drop data silently; the writer widens its schema before aligning
+        raise ValueError(f"Columns {sorted(extra)} are not in the parquet schema")
+    arrays = [
+        table.column(field.name).cast(field.type) if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+class ParquetChunkWriter:
+    """
+    Write DataFrame or Arrow table chunks into a single parquet file as they are produced.
+    
+    The schema starts as the one of the first non-empty chunk and is widened
+    (pa.unify_schemas, permissive) when a later chunk brings new columns, new
+    struct fields or values in a column that was all null so far; the rows
+    already written are then rewritten with the wider schema. The file is
+    written next to the target and only replaces it on close(); abort()
+    discards it.
+    """
+    
+    def __init__(self, name: str, processed: bool = False):
+        directory = PROCESSED_DATA_DIR if processed else RAW_DATA_DIR
+        os.makedirs(directory, exist_ok=True)
+        
+        self.name = name
+        self.file_path = os.path.join(directory, f"{name}.parquet")
+        self._tmp_path = f"{self.file_path}.tmp"
+        self._writer = None
+        self.num_rows = 0
+    
+    def write(self, chunk: Union[pd.DataFrame, pa.Table]) -> None:
+        """Append a chunk to the file, widening the schema first if the chunk needs it."""
+        if chunk is None or len(chunk) == 0:
+            return
+        table = chunk if isinstance(chunk, pa.Table) else pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._tmp_path, table.schema, compression=PARQUET_COMPRESSION)
+        elif not table.schema.equals(self._writer.schema):
+            schema = pa.unify_schemas([self._writer.schema, table.schema], promote_options="permissive")
+            if not schema.equals(self._writer.schema):
+                self._rewrite(schema)
+        self._writer.write_table(_align_table(table, self._writer.schema))
+        self.num_rows += table.num_rows
+    
+    def _rewrite(self, schema: pa.Schema) -> None:
+        """Copy the rows written so far into a new file with the wider schema."""
+        self._writer.close()
+        old_path = f"{self._tmp_path}.old"
+        os.replace(self._tmp_path, old_path)
+        self._writer = pq.ParquetWriter(self._tmp_path, schema, compression=PARQUET_COMPRESSION)
+        try:
+            for batch in pq.ParquetFile(old_path).iter_batches():
+                self._writer.write_table(_align_table(pa.Table.from_batches([batch]), schema))
+        finally:
+            os.remove(old_path)
+    
+    def close(self) -> Optional[str]:
+        """
+        Finish the file and move it into place.
+        
+        Returns:
+            Path to the saved file, or None if no non-empty chunk was written
+        """
+        if self._writer is None:
+            logger.warning(f"No data produced for {self.name}, not saving.")
+            return None
+        
+        self._writer.close()
+        self._writer = None
+        os.replace(self._tmp_path, self.file_path)
+        logger.info(f"Saved {self.num_rows} rows of {self.name} to {self.file_path}")
+        return self.file_path
+    
+    def abort(self) -> None:
+        """Discard everything written so far, leaving any previous file untouched."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.remove(self._tmp_path)
+
+def write_parquet_chunks(chunks: Iterable[Union[pd.DataFrame, pa.Table]], name: str,
+                         processed: bool = False) -> Optional[str]:
+    """
+    Stream DataFrame or Arrow table chunks into a single parquet file as they are produced.
+    
+    Only one chunk is held in memory at a time. See ParquetChunkWriter.
+    
+    Args:
+        chunks: Iterable of DataFrames or Arrow tables to write, in order
+        name: Name of the file (without extension)
+        processed: Whether to save to processed directory
+        
+    Returns:
+        Path to the saved file, or None if no non-empty chunk was produced
+    """
+    writer = ParquetChunkWriter(name, processed=processed)
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+def prefetch(iterable: Iterable[T], buffer: int = 1) -> Iterator[T]:
+    """
+    Produce items on a background thread, up to `buffer` items ahead of the consumer.
+    
+    Lets the next item (e.g. the next batch fetched from the API) be produced while
+    the current one is being processed. Exceptions raised by the producer are
+    re-raised in the consumer; if the consumer stops early, the producer is closed
+    after the item it is working on.
+    
+    Args:
+        iterable: Source of items; it is consumed on the background thread
+        buffer: How many produced items may wait for the consumer
+        
+    Yields:
+        The items of iterable, in order
+    """
+    items = queue.Queue(maxsize=buffer)
+    stop = threading.Event()
+    
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+            put((True, _PREFETCH_END))
+        except BaseException as e:
+            put((False, e))
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+    
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            ok, item = items.get()
+            if not ok:
+                raise item
+            if item is _PREFETCH_END:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate many small DataFrames into one compact DataFrame.
+    
+    Concatenating Arrow-backed columns (the default string dtype) keeps one
+    Arrow chunk per input frame, which makes every later vectorized op walk
+    thousands of tiny chunks. Those columns are combined into a single chunk.
+    
+    Args:
+        frames: DataFrames to concatenate
+        
+    Returns:
+        Concatenated DataFrame with a fresh RangeIndex
+    """
+    df = pd.concat(frames, ignore_index=True)
+    
+    for column in df.columns:
+        array = df[column].array
+        if not isinstance(array, pd.arrays.ArrowExtensionArray):
+            continue
+        chunked = array.__arrow_array__()
+        if chunked.num_chunks > 1:
+            df[column] = pd.array(chunked.combine_chunks(), dtype=array.dtype)
+    
+    return df
+
+def to_categories(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Convert low-cardinality string columns to the category dtype, in place.
+    
+    Args:
+        df: DataFrame to convert
+        columns: Candidate columns; the ones missing from df are skipped
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
 def get_last_update_date(entity_name: str) -> str:
     """
     Get the last update date for an entity.
@@ -113,30 +404,4 @@ def create_directory_if_not_exists(dir_path: str) -> None:
         dir_path: Path to the directory
     """
     Path(dir_path).mkdir(parents=True, exist_ok=True)
-    logger.debug(f"Ensured directory exists: {dir_path}")
-
-def commit_to_db(db: Session, objects, entity_name: str) -> int:
-    """
-    Commit objects to database.
-    
-    Args:
-        db: Database session
-        objects: List of objects to commit
-        entity_name: Name of the entity for logging
-    
-    Returns:
-        Number of objects committed
-    """
-    if not objects:
-        logger.warning(f"No {entity_name} to commit.")
-        return 0
-    
-    try:
-        db.add_all(objects)
-        db.commit()
-        logger.info(f"Committed {len(objects)} {entity_name} to database.")
-        return len(objects)
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error committing {entity_name} to database: {e}")
-        raise
\ No newline at end of file
+    logger.debug(f"Ensured directory exists: {dir_path}")
\ No newline at end of file
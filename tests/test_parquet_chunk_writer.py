@@ -0,0 +1,52 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.ingestion import utils
+from app.ingestion.utils import ParquetChunkWriter, write_parquet_chunks
+
+
+@pytest.fixture(autouse=True)
+def raw_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "RAW_DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_null_column_then_struct():
+    chunks = [
+        pa.table({"id": [1], "faseEvento": pa.nulls(1)}),
+        pa.table({"id": [2], "faseEvento": [{"titulo": "x"}]}),
+    ]
+
+    path = write_parquet_chunks(chunks, "discursos")
+
+    assert pq.read_table(path).to_pylist() == [
+        {"id": 1, "faseEvento": None},
+        {"id": 2, "faseEvento": {"titulo": "x"}},
+    ]
+
+
+def test_fields_appearing_after_the_first_chunk_are_kept():
+    chunks = [
+        pa.table({"id": [1], "faseEvento": [{"titulo": "a"}]}),
+        pa.table({"id": [2], "faseEvento": [{"titulo": "x", "dataHoraInicio": "2024-01-01"}],
+                  "urlAudio": ["u"]}),
+    ]
+
+    path = write_parquet_chunks(chunks, "discursos")
+
+    assert pq.read_table(path).to_pylist() == [
+        {"id": 1, "faseEvento": {"titulo": "a", "dataHoraInicio": None}, "urlAudio": None},
+        {"id": 2, "faseEvento": {"titulo": "x", "dataHoraInicio": "2024-01-01"}, "urlAudio": "u"},
+    ]
+
+
+def test_abort_keeps_previous_file(raw_data_dir):
+    assert write_parquet_chunks([pa.table({"id": [1]})], "deputados")
+
+    writer = ParquetChunkWriter("deputados")
+    writer.write(pa.table({"id": [2]}))
+    writer.abort()
+
+    assert pq.read_table(raw_data_dir / "deputados.parquet").to_pylist() == [{"id": 1}]
+    assert list(raw_data_dir.iterdir()) == [raw_data_dir / "deputados.parquet"]